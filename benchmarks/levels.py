@@ -0,0 +1,39 @@
+# usage: python -m benchmarks.levels [calls]
+import sys
+import random
+import timeit
+from skyblock_parser.levels import get_cata_lvl, get_skill_lvl, get_slayer_level, get_hotm_level, get_garden_lvl, get_cata_lvls, get_skill_lvls
+
+
+def bench():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    rng = random.Random(0)
+
+    cases = {
+        "get_cata_lvl": (get_cata_lvl, [(rng.uniform(0, 700000000),) for _ in range(1000)]),
+        "get_skill_lvl": (get_skill_lvl, [(rng.choice(["mining", "farming", "runecrafting", "social"]), rng.uniform(0, 120000000)) for _ in range(1000)]),
+        "get_slayer_level": (get_slayer_level, [(rng.choice(["zombie", "wolf", "vampire"]), rng.uniform(0, 1200000)) for _ in range(1000)]),
+        "get_hotm_level": (get_hotm_level, [(rng.uniform(0, 1500000),) for _ in range(1000)]),
+        "get_garden_lvl": (get_garden_lvl, [(rng.uniform(0, 70000),) for _ in range(1000)]),
+    }
+
+    for name, (func, args) in cases.items():
+        rounds = max(calls // len(args), 1)
+        elapsed = timeit.timeit(lambda: [func(*arg) for arg in args], number=rounds)
+        print(f"{name:<18} {elapsed / (rounds * len(args)) * 1e9:8.0f} ns/call")
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("numpy not installed, skipping batch functions")
+        return
+
+    # one call per curve for every member's xp
+    exps = np.array([rng.uniform(0, 120000000) for _ in range(calls)])
+    for name, func in {"get_cata_lvls": get_cata_lvls, "get_skill_lvls": lambda x: get_skill_lvls("mining", x)}.items():
+        elapsed = timeit.timeit(lambda: func(exps), number=10) / 10
+        print(f"{name:<18} {elapsed / len(exps) * 1e9:8.0f} ns/value ({len(exps)} values)")
+
+
+if __name__ == "__main__":
+    bench()
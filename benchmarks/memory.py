@@ -0,0 +1,114 @@
+# usage: python -m benchmarks.memory [items] [pets]
+# memory held by the Items/Pets of a synthetic large account, against the old __dict__ based layout
+import sys
+import random
+import tracemalloc
+from skyblock_parser.profile import Item
+from skyblock_parser.pets import Pet
+
+
+class DictItem:
+    """
+    Item as it was before __slots__, lore rewritten up front
+    """
+
+    def __init__(self, data):
+        self.count = data.get("Count", 1)
+
+        tag = data.get("tag", {})
+        display = tag.get("display", {})
+
+        self.lore = [line.replace("§", "&") for line in [display.get("Name", ""), *display.get("Lore", [])]]
+
+        attributes = tag.get("ExtraAttributes", {})
+        self.hot_potato_count = attributes.get("hot_potato_count", 0)
+        self.reforge = attributes.get("modifier", "")
+        self.stars = attributes.get("upgrade_level", 0)
+        self._id = attributes.get("id", "")
+        self.enchantments = attributes.get("enchantments", {})
+        self.item_uuid = attributes.get("uuid", "")
+        self.rarity_upgrades = attributes.get("rarity_upgrades", 0)
+        self.soulbound = bool(attributes.get("donated_museum")) or any("Soulbound" in line for line in self.lore)
+
+
+class DictPet:
+    def __init__(self, data):
+        display = data.get("display", {})
+        self.lore = [line.replace("§", "&") for line in [display.get("Name", ""), *display.get("Lore", [])]]
+        self.uuid = data.get("uuid", "")
+        self.active = False
+        self.type = data.get("type", "")
+        self.exp = data.get("exp", 0)
+        self.tier = data.get("tier", 0)
+        self.rarity_color = "6"
+        self.held_item = data.get("heldItem", "")
+        self.candy_used = data.get("candyUsed", 0)
+        self.skin = data.get("skin", "")
+        self.max_level = 100
+        self.level = 100
+        self.max_xp = 25353230
+
+
+def synthetic_item(rng, index):
+    return {
+        "Count": 1,
+        "tag": {
+            "display": {
+                "Name": f"§6Hyperion {index}",
+                "Lore": [f"§7Damage: §c+{rng.randint(100, 500)}", "§7Strength: §c+150 §9(+30)", "§8Gear Score: 1234"] * 6 + ["§d§lMYTHIC DUNGEON SWORD"]
+            },
+            "ExtraAttributes": {
+                "id": rng.choice(["HYPERION", "TERMINATOR", "ASPECT_OF_THE_END", "JUJU_SHORTBOW"]),
+                "uuid": f"{index:032x}",
+                "hot_potato_count": rng.randint(0, 15),
+                "modifier": "heroic",
+                "enchantments": {"sharpness": 6, "critical": 6, "ultimate_wise": 5}
+            }
+        }
+    }
+
+
+def synthetic_pet(rng, index):
+    return {
+        "uuid": f"{index:032x}",
+        "type": rng.choice(["ENDER_DRAGON", "GRIFFIN", "BLUE_WHALE"]),
+        "tier": "LEGENDARY",
+        "exp": rng.randint(0, 30000000),
+        "heldItem": "PET_ITEM_TIER_BOOST",
+        "display": {"Name": f"§7[Lvl 100] §6Pet {index}", "Lore": ["§8Combat Pet", "§7Strength: §a+50"] * 8}
+    }
+
+
+def measure(build, data):
+    tracemalloc.start()
+    objects = [build(entry) for entry in data]
+    size = tracemalloc.get_traced_memory()[0]
+
+    for obj in objects:
+        obj.lore
+    touched = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+    return size, touched
+
+
+def bench():
+    item_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    pet_count = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    rng = random.Random(0)
+    items = [synthetic_item(rng, i) for i in range(item_count)]
+    pets = [synthetic_pet(rng, i) for i in range(pet_count)]
+
+    for name, build, data in [
+        ("DictItem", DictItem, items),
+        ("Item", Item, items),
+        ("DictPet", DictPet, pets),
+        ("Pet", lambda data: Pet(data, False), pets)
+    ]:
+        size, touched = measure(build, data)
+        print(f"{name:<9} {size / 1024 / 1024:7.2f} MB, {size / len(data):6.0f} B each, {touched / 1024 / 1024:7.2f} MB with lore read")
+
+
+if __name__ == "__main__":
+    bench()
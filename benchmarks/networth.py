@@ -0,0 +1,54 @@
+# usage: python -m benchmarks.networth <profiles.json> <uuid> [runs]
+# profiles.json is a saved /v2/skyblock/profiles response, networth_api.js must be running
+import sys
+import json
+import time
+import asyncio
+import aiohttp
+from skyblock_parser.profile import SkyblockParser, close_default_session
+from skyblock_parser.auctionhouse import AuctionHouseParser
+
+
+async def bench():
+    path, uuid = sys.argv[1], sys.argv[2]
+    runs = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+    with open(path) as f:
+        data = json.load(f)
+
+    async with aiohttp.ClientSession() as session:
+        auction_house = AuctionHouseParser(session, history_path=None)
+        # the same refresh the bot runs, so price keys the auction scan misses show up as a difference
+        await auction_house.update_caches()
+
+        sidecar = SkyblockParser(data, uuid, "").select_profile("selected")
+        start = time.perf_counter()
+        for _ in range(runs):
+            sidecar.networth_data = None
+            await sidecar.get_networth()
+        sidecar_time = (time.perf_counter() - start) / runs
+
+        native = SkyblockParser(data, uuid, "", auction_house).select_profile("selected")
+        start = time.perf_counter()
+        for _ in range(runs):
+            native.networth_data = None
+            await native.get_networth()
+        native_time = (time.perf_counter() - start) / runs
+
+    await close_default_session()
+
+    expected = sidecar.networth_data.get("networth", 0)
+    actual = native.networth_data["networth"]
+    difference = abs(actual - expected) / expected if expected else 0
+
+    print(f"sidecar: {sidecar_time * 1000:.2f} ms, networth {expected:,.0f}")
+    print(f"native:  {native_time * 1000:.2f} ms, networth {actual:,.0f}")
+    print(f"difference: {difference:.2%}")
+
+    for name, category in native.networth_data["types"].items():
+        sidecar_total = sidecar.networth_data.get("types", {}).get(name, {}).get("total", 0)
+        print(f"  {name:<15} native {category['total']:>16,.0f}  sidecar {sidecar_total:>16,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(bench())
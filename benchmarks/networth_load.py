@@ -0,0 +1,56 @@
+# usage: python -m benchmarks.networth_load <profiles.json> <uuid> [count] [concurrency]
+# start the sidecar first, e.g. WORKERS=0 node networth_api.js to use every core
+import sys
+import json
+import time
+import asyncio
+from skyblock_parser.profile import SkyblockParser, Profile, close_default_session
+from skyblock_parser.cache import networth_cache
+
+
+def make_profiles(data, uuid, count):
+    return [SkyblockParser(data, uuid, "").select_profile("selected") for _ in range(count)]
+
+
+async def single(profiles, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(profile):
+        async with semaphore:
+            await profile.get_networth()
+
+    await asyncio.gather(*[run(profile) for profile in profiles])
+
+
+async def load_test():
+    path, uuid = sys.argv[1], sys.argv[2]
+    count = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    concurrency = int(sys.argv[4]) if len(sys.argv) > 4 else 16
+
+    with open(path) as f:
+        data = json.load(f)
+
+    # identical profiles would all be served from the cache after the first one
+    networth_cache.entries.max_size = 0
+
+    profiles = make_profiles(data, uuid, count)
+    start = time.perf_counter()
+    await single(profiles, concurrency)
+    elapsed = time.perf_counter() - start
+    print(f"/networth        {count} profiles in {elapsed:.2f}s ({count / elapsed:.1f}/s, concurrency {concurrency})")
+
+    profiles = make_profiles(data, uuid, count)
+    start = time.perf_counter()
+    await Profile.get_networth_batch(profiles)
+    elapsed = time.perf_counter() - start
+    print(f"/networth/batch  {count} profiles in {elapsed:.2f}s ({count / elapsed:.1f}/s)")
+
+    failed = sum(1 for profile in profiles if profile.networth_data == {"networth": 0})
+    if failed:
+        print(f"{failed} profiles failed")
+
+    await close_default_session()
+
+
+if __name__ == "__main__":
+    asyncio.run(load_test())
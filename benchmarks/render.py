@@ -0,0 +1,58 @@
+# usage: python -m benchmarks.render [runs]
+# render() time for a 30 line tooltip, formatting like a heavily upgraded weapon
+# ascii only so every revision of the renderer can draw it, fonts/unifont.ttf is not shipped
+import sys
+import time
+from skyblock_parser.renderer import render
+
+TOOLTIP = [
+    "&d&lHeroic Hyperion &6+5",
+    "&7Gear Score: &d1250 &8(4320)",
+    "&7Damage: &c+310 &e(+30) &8(+1,240.8)",
+    "&7Strength: &c+200 &e(+30) &6[+5] &9(+50) &8(+812.2)",
+    "&7Crit Damage: &c+70% &8(+294%)",
+    "&7Bonus Attack Speed: &c+7% &9(+7%) &8(+10.5%)",
+    "&7Intelligence: &a+592 &9(+125) &d(+60) &8(+2,321.2)",
+    "&7Ferocity: &a+33 &8(+46.2)",
+    "",
+    "&d&lUltimate Wise V&9, Cleave VI, Critical VI",
+    "&9Cubism VI, Ender Slayer VI, Execute V",
+    "&9Experience V, Fire Aspect III, First Strike V",
+    "&9Giant Killer VI, Impaling III, Lethality VI",
+    "&9Looting V, Luck VI, Scavenger V, Sharpness VI",
+    "&9Syphon V, Thunderlord VI, Vampirism VI",
+    "",
+    "&7Deals &c+50% &7damage to Withers.",
+    "&7Grants &c+1 Damage &7and &a+2 Intelligence",
+    "&7per &cCatacombs &7level.",
+    "",
+    "&aScroll Abilities:",
+    "&6Ability: Wither Impact  &e&lRIGHT CLICK",
+    "&7Teleports &a10 blocks &7ahead of you.",
+    "&7Then implode dealing &c29,450.1 &7damage",
+    "&7to nearby enemies. Also applies the wither",
+    "&7shield scroll ability reducing damage",
+    "&7taken and granting an absorption shield",
+    "&7for &e5 &7seconds.",
+    "&8Mana Cost: &3150",
+    "&d&l&ka&r &d&lMYTHIC DUNGEON SWORD &d&l&ka",
+]
+
+
+def bench():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    start = time.perf_counter()
+    render(list(TOOLTIP))
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        render(list(TOOLTIP))
+    elapsed = (time.perf_counter() - start) / runs
+
+    print(f"first render {first * 1000:.1f} ms, then {elapsed * 1000:.1f} ms per {len(TOOLTIP)} line tooltip")
+
+
+if __name__ == "__main__":
+    bench()
@@ -0,0 +1,53 @@
+import discord
+from discord.ext import commands
+from utils.checks import owner_only
+from utils.monitor import loop_monitor
+
+
+class Monitor(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    monitor = discord.SlashCommandGroup("monitor", "Event loop monitoring")
+
+    @monitor.command(name="toggle", description="Turn the event loop monitor on or off")
+    @owner_only()
+    async def monitor_toggle(self, ctx: discord.ApplicationContext):
+        """Start or stop the event loop monitor."""
+        enabled = loop_monitor.toggle()
+
+        embed = discord.Embed(
+            title="Loop Monitor",
+            description=f"The event loop monitor is now **{'enabled' if enabled else 'disabled'}**",
+            color=0x2F3136
+        )
+        await ctx.respond(embed=embed, ephemeral=True)
+
+    @monitor.command(name="status", description="View event loop lag and recent blocking calls")
+    @owner_only()
+    async def monitor_status(self, ctx: discord.ApplicationContext):
+        """Show loop lag statistics and the latest blocking calls."""
+        stats = loop_monitor.stats()
+
+        embed = discord.Embed(
+            title="Loop Monitor",
+            description=f"Monitor is **{'enabled' if stats['enabled'] else 'disabled'}**, {stats['samples']} samples",
+            color=0x2F3136
+        )
+        embed.add_field(name="Average Lag", value=f"{stats['avg_ms']:.1f}ms", inline=True)
+        embed.add_field(name="P95 Lag", value=f"{stats['p95_ms']:.1f}ms", inline=True)
+        embed.add_field(name="Max Lag", value=f"{stats['max_ms']:.1f}ms", inline=True)
+
+        blocks = list(loop_monitor.blocks)[-5:]
+        if blocks:
+            embed.add_field(
+                name="Recent Blocking Calls",
+                value="\n".join(f"<t:{int(block['time'])}:R> **{block['duration'] * 1000:.0f}ms** `{block['source']}`" for block in reversed(blocks))[:1024],
+                inline=False
+            )
+
+        await ctx.respond(embed=embed, ephemeral=True)
+
+
+def setup(bot):
+    bot.add_cog(Monitor(bot))
@@ -1,17 +1,38 @@
 import discord
 from discord.ext import commands
 import os
-from config import BOT
+import config
+from config import BOT, HYPIXEL_API_KEY
 from utils.status import status, activity
+from utils.http import http_client
+from skyblock_parser.hypixel import HypixelClient
+from skyblock_parser.auctionhouse import AuctionHouseParser
+from skyblock_parser.mojang import mojang_resolver
+from skyblock_parser.executor import cpu_executor
+from utils.monitor import loop_monitor
 
 intents = discord.Intents.all()
 bot = commands.Bot(command_prefix="!", intents=intents)
+bot.http_client = http_client # one pooled session, pass http_client.get_session() to the parsers
+cpu_executor.configure(**getattr(config, "CPU_EXECUTOR", {}))
 commands_folder = BOT["COGS_FOLDER"]
 
 
 @bot.event
 async def on_ready():
     print(f'Started - {bot.user} (ID: {bot.user.id})')
+
+    if getattr(bot, "hypixel", None) is None:
+        api_keys = getattr(config, "HYPIXEL_API_KEYS", []) or [HYPIXEL_API_KEY]
+        bot.hypixel = HypixelClient(http_client.get_session(), api_keys) # shared, so every command queues on the same rate limit
+        mojang_resolver.session = http_client.get_session()
+
+        # prices for networth and lowest BIN lookups, refreshed together with the sold price windows
+        bot.auction_house = AuctionHouseParser(http_client.get_session(), hypixel=bot.hypixel, history_path=getattr(config, "PRICE_HISTORY_PATH", None))
+        bot.auction_house.start(**getattr(config, "AUCTION_HOUSE", {}))
+
+        if getattr(config, "LOOP_MONITOR", True):
+            loop_monitor.start()
     
     bot_status = status(BOT)
     bot_activity = activity(BOT)
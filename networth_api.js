@@ -1,4 +1,6 @@
 // server.js
+const cluster = require('node:cluster');
+const os = require('node:os');
 const express = require('express');
 const {
   ProfileNetworthCalculator,
@@ -6,28 +8,65 @@ const {
   // NetworthManager, getPrices
 } = require('skyhelper-networth');
 
-const app = express();
 const port = process.env.PORT || 5000;
+// WORKERS=0 uses every core, unset keeps the single process
+const workers = process.env.WORKERS === '0' ? os.availableParallelism() : Number(process.env.WORKERS || 1);
 
-app.use(express.json({ limit: '20mb' }));
+async function calculate({ profile, bank, museumData }) {
+  const calc = new ProfileNetworthCalculator(profile, museumData, bank);
 
+  return calc.getNetworth({
+  });
+}
 
-app.post('/networth', async (req, res) => {
-  try {
-    const { profile, bank, museumData } = req.body;
+function start() {
+  const app = express();
 
-    const calc = new ProfileNetworthCalculator(profile, museumData, bank);
+  app.use(express.json({ limit: '100mb' }));
 
-    const networth = await calc.getNetworth({
-    });
 
-    res.send(networth);
-  } catch (err) {
-    res.status(400).send(err?.message || 'Failed to compute networth');
-  }
-});
+  app.post('/networth', async (req, res) => {
+    try {
+      const networth = await calculate(req.body);
+
+      res.send(networth);
+    } catch (err) {
+      res.status(400).send(err?.message || 'Failed to compute networth');
+    }
+  });
+
+  app.post('/networth/batch', async (req, res) => {
+    const { profiles } = req.body;
+
+    if (!Array.isArray(profiles)) {
+      return res.status(400).send('profiles must be an array');
+    }
 
-app.listen(port, () => {
-  console.log(`Running on port ${port}`);
-});
+    const results = await Promise.all(profiles.map(async (entry) => {
+      try {
+        return { id: entry.id, networth: await calculate(entry) };
+      } catch (err) {
+        return { id: entry.id, error: err?.message || 'Failed to compute networth' };
+      }
+    }));
+
+    res.send(results);
+  });
+
+  app.listen(port, () => {
+    console.log(`Running on port ${port} (pid ${process.pid})`);
+  });
+}
+
+if (workers > 1 && cluster.isPrimary) {
+  for (let i = 0; i < workers; i++) {
+    cluster.fork();
+  }
 
+  cluster.on('exit', (worker) => {
+    console.log(`Worker ${worker.process.pid} died, restarting`);
+    cluster.fork();
+  });
+} else {
+  start();
+}
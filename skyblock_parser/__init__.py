@@ -4,4 +4,13 @@ from skyblock_parser.levels import *
 from skyblock_parser.profile import *
 from skyblock_parser.renderer import *
 from skyblock_parser.pets import *
-from skyblock_parser.auctionhouse import *
\ No newline at end of file
+from skyblock_parser.auctionhouse import *
+from skyblock_parser.pricing import *
+from skyblock_parser.sales import *
+from skyblock_parser.history import *
+from skyblock_parser.networth import *
+from skyblock_parser.cache import *
+from skyblock_parser.hypixel import *
+from skyblock_parser.mojang import *
+from skyblock_parser.executor import *
+from skyblock_parser.lore import *
\ No newline at end of file
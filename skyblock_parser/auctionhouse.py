@@ -4,10 +4,15 @@ import struct
 import asyncio
 import aiohttp
 import json
-import copy
+import time
 
-from .renderer import render
+from .renderer import render_async
+from .executor import cpu_executor
 from .exceptions import SkyblockParserException
+from .pricing import PriceEngine, price_key
+from .sales import SalesTracker
+from .history import PriceHistory
+from .hypixel import HypixelClient
 
 def TAG_End(b):
     return None, b
@@ -124,26 +129,49 @@ def decode_item(nbt):
     return data
 
 
+def ended_sales(auctions):
+    """
+    (auction_id, item_id, price, timestamp) for every ended auction that decodes, only the id is kept from the item
+    """
+    sales = []
+    for i in auctions:
+        try:
+            item_id = decode_item(i['item_bytes'])['']['i'][0]['tag']['ExtraAttributes']['id']
+        except:
+            continue
+
+        sales.append((i['auction_id'], item_id, i['price'], i['timestamp'] / 1000))
+    return sales
+
+
 class AuctionHouseParser:
-    def __init__(self, session:aiohttp.ClientSession):
+    def __init__(self, session:aiohttp.ClientSession, history_path=None, hypixel:HypixelClient=None, fallback_interval=6 * 60 * 60):
 
         self.session = session
+        self.hypixel = hypixel or HypixelClient(session)
         self.loop = asyncio.get_event_loop()
 
         self.auction_cache = []
         self.temp = []
         
         self.prices = {}
+        self.prices_updated_at = 0
+        self.fallback_interval = fallback_interval
+        self.fallback_updated_at = None
+        self.price_engine = PriceEngine()
+        self.sales = SalesTracker()
+        self.sales_task = None
+        self.refresh_task = None
+        self.history = PriceHistory(history_path) if history_path else None
         self.item_table = {}
+        self.upgrade_costs = {}
 
 
     async def get_page_count(self):
-        r = await self.session.get("https://api.hypixel.net/skyblock/auctions")
-        return (await r.json())['totalPages']
+        return (await self.hypixel.get_auctions())['totalPages']
     
     async def get_page(self, page):
-        r = await self.session.get(f"https://api.hypixel.net/skyblock/auctions?page={page}")
-        data = await r.json()
+        data = await self.hypixel.get_auctions(page)
         items = []
         
         if not data['success']:
@@ -155,7 +183,9 @@ class AuctionHouseParser:
 
             try:
                 decoded = decode_item(i['item_bytes'])
-                self.temp.append({"id": decoded['']['i'][0]['tag']['ExtraAttributes']['id'],
+                attributes = decoded['']['i'][0]['tag']['ExtraAttributes']
+                self.temp.append({"id": attributes['id'],
+                        "price_key": price_key(attributes),
                         "price": i['starting_bid'], 
                         "command": f"/viewauction {i['uuid']}", 
                         "itemName": str(decoded['']['i'][0]['tag']['display']['Name']).replace("§", "&").replace("Â", ""), 
@@ -174,37 +204,120 @@ class AuctionHouseParser:
         )
         await gather
 
-        self.auction_cache.clear()
-        self.auction_cache = copy.deepcopy(self.temp)
+        # hand the finished list over, lowest_price() returns copies so cached entries stay as parsed
+        self.auction_cache = self.temp
+        self.temp = []
+
+        self.price_engine.update(self.auction_cache)
+
+        if self.history is not None:
+            await self.loop.run_in_executor(None, self.history.record, self.auction_cache)
+
+    async def price_history(self, itemName, start=None, end=None):
+        item_id = self.item_table.get(itemName, None)
+
+        if item_id is None:
+            raise SkyblockParserException("Item not found")
+
+        if self.history is None:
+            return []
 
-        self.temp.clear()
+        return await self.loop.run_in_executor(None, self.history.series, item_id, start, end)
 
 
     async def update_caches(self):
         await self.cache_all_auctions()
         gather = asyncio.gather(
             self.update_item_table(),
-            self.update_prices()
+            self.update_fallback_prices()
         )
         await gather
+        await self.update_prices()
+
+    async def update_fallback_prices(self):
+        # fills in whatever isn't listed right now, update_prices() overwrites it with our own prices.
+        # prices.json is large and only moves slowly, so it is fetched once and then every fallback_interval
+        if self.fallback_updated_at is not None and time.time() - self.fallback_updated_at < self.fallback_interval:
+            return
+
+        try:
+            await self.update_remote_prices()
+            self.fallback_updated_at = time.time()
+        except Exception as e:
+            print(f"Warning: Could not fetch fallback prices: {e}")
 
     async def update_item_table(self):
-        r = await self.session.get("https://api.hypixel.net/resources/skyblock/items")
-        data = await r.json()
+        data = await self.hypixel.get_items()
         for item in data['items']:
             self.item_table[item['name']] = item['id']
+            if 'upgrade_costs' in item:
+                self.upgrade_costs[item['id']] = item['upgrade_costs']
 
     async def update_prices(self):
+        self.prices.update(self.price_engine.prices)
+        self.prices_updated_at = time.time()
+
+    async def update_remote_prices(self):
         r = await self.session.get("https://raw.githubusercontent.com/SkyHelperPrices/main/prices.json")
-        self.prices = json.loads(await r.text()) # do not ask why it didnt work otherwise
+        self.prices.update(json.loads(await r.text())) # do not ask why it didnt work otherwise
+        self.prices_updated_at = time.time()
+
+    async def update_sales(self):
+        data = await self.hypixel.get_ended_auctions()
+
+        if not data.get('success'):
+            return
+
+        # ~1000 gzipped NBT blobs per poll, decoded off the event loop
+        for sale in await cpu_executor.run(ended_sales, data['auctions']):
+            self.sales.add(*sale)
+
+    async def sales_loop(self, interval):
+        while True:
+            try:
+                await self.update_sales()
+            except Exception as e:
+                print(f"Warning: Could not update ended auctions: {e}")
+            await asyncio.sleep(interval)
+
+    def start_sales_task(self, interval=60):
+        if self.sales_task is None or self.sales_task.done():
+            self.sales_task = self.loop.create_task(self.sales_loop(interval))
+        return self.sales_task
+
+    async def refresh_loop(self, interval):
+        while True:
+            try:
+                await self.update_caches()
+            except Exception as e:
+                print(f"Warning: Could not refresh the auction house: {e}")
+            await asyncio.sleep(interval)
+
+    def start(self, interval=5 * 60, sales_interval=60):
+        """
+        Keeps the snapshot, prices and sale windows fresh in the background
+        """
+        if self.refresh_task is None or self.refresh_task.done():
+            self.refresh_task = self.loop.create_task(self.refresh_loop(interval))
+        self.start_sales_task(sales_interval)
+        return self.refresh_task
+
+    async def sold_prices(self, itemName):
+        item_id = self.item_table.get(itemName, None)
+
+        if item_id is None:
+            raise SkyblockParserException("Item not found")
+
+        return self.sales.stats(item_id)
 
     async def lowest_price(self, itemName):
         item_id = self.item_table.get(itemName, None)
-        value = self.prices.get(item_id.lower(), 0)
 
         if item_id is None:
             raise SkyblockParserException("Item not found")
 
+        value = self.prices.get(item_id.lower(), 0)
+
         lowest_price = None
         data = None
 
@@ -217,9 +330,7 @@ class AuctionHouseParser:
                 lowest_price = item['price']
                 data = item
 
-        data['value_clean'] = value
-            
-        return data
+        return {**data, "value_clean": value}
     
 
     async def render_lowest_price(self, itemName):
@@ -242,9 +353,5 @@ class AuctionHouseParser:
                 lowest_price = item['price']
                 data = item
 
-        lore = data['itemLore'].split("\n")
-        name = data['itemName']
-
-        lore.insert(0, name)
-
-        return render(lore)
+        # render() tokenizes through the shared memoized tokenizer, the snapshot keeps the & strings
+        return await render_async([data['itemName'], *data['itemLore'].split("\n")])
@@ -0,0 +1,233 @@
+import os
+import json
+import asyncio
+import time
+import zlib
+import hashlib
+import threading
+from collections import OrderedDict
+from .executor import cpu_executor
+
+
+# member sections the networth depends on, also all the sidecar gets sent
+# skyhelper-networth reads the personal bank from profile.bank_account and candy/mask bags from shared_inventory
+NETWORTH_SECTIONS = ["inventory", "pets_data", "currencies", "rift", "profile", "shared_inventory"]
+
+
+def content_hash(*sections):
+    # the base64 inventory blobs are most of the data, they are fed to the hash as they are
+    # instead of building a multi-MB json string around them first
+    digest = hashlib.blake2b(digest_size=16)
+    feed_hash(digest, sections)
+    return digest.hexdigest()
+
+
+def feed_hash(digest, value):
+    if isinstance(value, str):
+        digest.update(b"s%d:" % len(value))
+        digest.update(value.encode())
+    elif isinstance(value, dict):
+        digest.update(b"d%d:" % len(value))
+        for key in sorted(value, key=str):
+            feed_hash(digest, str(key))
+            feed_hash(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"l%d:" % len(value))
+        for item in value:
+            feed_hash(digest, item)
+    else:
+        digest.update(b"v%s;" % repr(value).encode())
+
+
+class LRU:
+    """
+    Mapping that drops the least recently used keys once it holds more than max_size
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def set(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        return self.entries.pop(key, default)
+
+
+class NetworthCache:
+    """
+    Networth results shared between Profile instances, keyed by profile id and a hash of the inventory
+    """
+
+    def __init__(self, ttl=600, max_size=1000):
+        self.ttl = ttl
+        self.entries = LRU(max_size)
+
+    async def key(self, profile):
+        # hashing a few MB of inventory takes milliseconds, keep it off the loop
+        sections = [profile.profile_data_user.get(section, {}) for section in NETWORTH_SECTIONS]
+        return profile.profile_id, await cpu_executor.run(content_hash, sections, profile.bank_balance, profile.museum_data)
+
+    def get(self, key, price_version=None):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        data, version, created_at = entry
+
+        # prices moved on since this was computed, or the sidecar's prices probably did
+        if version != price_version or time.time() - created_at > self.ttl:
+            self.entries.pop(key)
+            return None
+
+        return data
+
+    def set(self, key, data, price_version=None):
+        self.entries.set(key, (data, price_version, time.time()))
+
+
+networth_cache = NetworthCache()
+
+
+class ItemValuationCache:
+    """
+    Item values keyed by item uuid and an attribute fingerprint, only valid for the price snapshot they were computed with
+    """
+
+    def __init__(self, max_size=100000):
+        self.entries = LRU(max_size)
+        # networth calculations run in executor threads, several at once
+        self.lock = threading.Lock()
+
+    def get(self, key, price_version):
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is None or entry[0] != price_version:
+            return None
+        return entry[1]
+
+    def set(self, key, value, price_version):
+        with self.lock:
+            self.entries.set(key, (price_version, value))
+
+
+item_value_cache = ItemValuationCache()
+
+
+def encode_response(data):
+    return zlib.compress(json.dumps(data, separators=(",", ":")).encode())
+
+
+def decode_response(compressed):
+    return json.loads(zlib.decompress(compressed))
+
+
+class ResponseCache:
+    """
+    Raw API responses kept zlib-compressed in memory, optionally mirrored to disk so they survive restarts
+    """
+
+    def __init__(self, ttl=60, max_stale=900, max_size=500, disk_path=None):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.disk_path = disk_path
+        self.entries = LRU(max_size)
+        self.pruned_at = 0
+
+        if disk_path:
+            os.makedirs(disk_path, exist_ok=True)
+
+    def file_path(self, key):
+        return os.path.join(self.disk_path, f"{key}.json.z")
+
+    async def get(self, key):
+        """
+        Returns (data, age), data is None when nothing usable is cached
+        """
+        entry = self.entries.get(key)
+
+        if entry is None and self.disk_path:
+            entry = await asyncio.get_running_loop().run_in_executor(None, self.read_file, key)
+            if entry is not None:
+                self.entries.set(key, entry)
+
+        if entry is None:
+            return None, None
+
+        compressed, fetched_at = entry
+        age = time.time() - fetched_at
+        if age > self.max_stale:
+            self.entries.pop(key)
+            if self.disk_path:
+                await asyncio.get_running_loop().run_in_executor(None, self.remove_file, key)
+            return None, age
+
+        # a profile response can be several MB, (de)serializing it would stall the loop
+        return await asyncio.get_running_loop().run_in_executor(None, decode_response, compressed), age
+
+    async def set(self, key, data):
+        loop = asyncio.get_running_loop()
+        compressed = await loop.run_in_executor(None, encode_response, data)
+        self.entries.set(key, (compressed, time.time()))
+
+        if self.disk_path:
+            await loop.run_in_executor(None, self.write_file, key, compressed)
+
+            if time.time() - self.pruned_at > self.max_stale:
+                self.pruned_at = time.time()
+                await loop.run_in_executor(None, self.prune)
+
+    def read_file(self, key):
+        path = self.file_path(key)
+        try:
+            with open(path, "rb") as f:
+                return f.read(), os.path.getmtime(path)
+        except FileNotFoundError:
+            return None
+
+    def write_file(self, key, compressed):
+        with open(self.file_path(key), "wb") as f:
+            f.write(compressed)
+
+    def remove_file(self, key):
+        try:
+            os.remove(self.file_path(key))
+        except FileNotFoundError:
+            pass
+
+    def prune(self):
+        """
+        Deletes files past max_stale, and the oldest ones beyond max_size
+        """
+        files = []
+        for name in os.listdir(self.disk_path):
+            if not name.endswith(".json.z"):
+                continue
+            path = os.path.join(self.disk_path, name)
+            try:
+                files.append((os.path.getmtime(path), path))
+            except FileNotFoundError:
+                continue
+
+        files.sort(reverse=True)
+        cutoff = time.time() - self.max_stale
+        for index, (modified, path) in enumerate(files):
+            if modified < cutoff or index >= self.entries.max_size:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
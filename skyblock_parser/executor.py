@@ -0,0 +1,52 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+EXECUTOR_KINDS = ("thread", "process", "inline")
+
+
+class CPUExecutor:
+    """
+    Runs parsing and rendering off the event loop.
+    "thread" keeps the loop responsive, "process" also uses more cores but arguments and results get pickled,
+    "inline" runs on the loop like before (debugging)
+    """
+
+    def __init__(self, kind="thread", max_workers=None):
+        self.kind = None
+        self.max_workers = None
+        self.pool = None
+        self.configure(kind, max_workers)
+
+    def configure(self, kind="thread", max_workers=None):
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor kind {kind!r}, expected one of {', '.join(EXECUTOR_KINDS)}")
+
+        if (kind, max_workers) != (self.kind, self.max_workers):
+            self.shutdown(wait=False)
+        self.kind = kind
+        self.max_workers = max_workers
+
+    def get_pool(self):
+        if self.pool is None and self.kind != "inline":
+            pool_class = ProcessPoolExecutor if self.kind == "process" else ThreadPoolExecutor
+            self.pool = pool_class(max_workers=self.max_workers)
+        return self.pool
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Awaitable func(*args, **kwargs), func has to be a module level function in process mode
+        """
+        if self.kind == "inline":
+            return func(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.get_pool(), functools.partial(func, *args, **kwargs))
+
+    def shutdown(self, wait=True):
+        if self.pool is not None:
+            self.pool.shutdown(wait=wait, cancel_futures=True)
+            self.pool = None
+
+
+cpu_executor = CPUExecutor()
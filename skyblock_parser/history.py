@@ -0,0 +1,119 @@
+import os
+import sqlite3
+import time
+
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# (tier, bucket size, how long rows stay in the tier before being rolled up into the next one)
+HISTORY_TIERS = [
+    ("raw", None, DAY),
+    ("hourly", HOUR, 30 * DAY),
+    ("daily", DAY, None),
+]
+
+
+class PriceHistory:
+    """
+    Lowest BIN and listing count per item, downsampled as it ages
+    """
+
+    def __init__(self, db_path="./database/price_history.db"):
+        self.db_path = db_path
+        self.database_ready = False
+
+    def init_database(self):
+        if self.database_ready:
+            return
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS bin_history (
+                item_id TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,
+                tier TEXT NOT NULL,
+                lowest REAL NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (item_id, timestamp, tier)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS bin_history_tier ON bin_history (tier, timestamp)
+        ''')
+
+        conn.commit()
+        conn.close()
+        self.database_ready = True
+
+    def get_db_connection(self):
+        # created on first use, which is always in the executor, so constructing this never touches the disk
+        self.init_database()
+        return sqlite3.connect(self.db_path)
+
+    def record(self, auctions, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        timestamp = int(timestamp)
+
+        summary = {}
+        for auction in auctions:
+            lowest, count = summary.get(auction['id'], (auction['price'], 0))
+            summary[auction['id']] = (min(lowest, auction['price']), count + 1)
+
+        conn = self.get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.executemany('''
+            INSERT OR REPLACE INTO bin_history (item_id, timestamp, tier, lowest, count)
+            VALUES (?, ?, 'raw', ?, ?)
+        ''', [(item_id, timestamp, lowest, count) for item_id, (lowest, count) in summary.items()])
+
+        self.downsample(cursor, timestamp)
+
+        conn.commit()
+        conn.close()
+
+    def downsample(self, cursor, now):
+        for (tier, _, keep), (next_tier, bucket, _) in zip(HISTORY_TIERS, HISTORY_TIERS[1:]):
+            # only roll up whole buckets, so a bucket never gets written twice
+            cutoff = now - keep
+            cutoff -= cutoff % bucket
+
+            cursor.execute('''
+                INSERT OR REPLACE INTO bin_history (item_id, timestamp, tier, lowest, count)
+                SELECT item_id, timestamp - timestamp % ?, ?, MIN(lowest), CAST(ROUND(AVG(count)) AS INTEGER)
+                FROM bin_history
+                WHERE tier = ? AND timestamp < ?
+                GROUP BY item_id, timestamp - timestamp % ?
+            ''', (bucket, next_tier, tier, cutoff, bucket))
+
+            cursor.execute('''
+                DELETE FROM bin_history WHERE tier = ? AND timestamp < ?
+            ''', (tier, cutoff))
+
+    def series(self, item_id, start=None, end=None):
+        if start is None:
+            start = 0
+        if end is None:
+            end = time.time()
+
+        conn = self.get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT timestamp, lowest, count FROM bin_history
+            WHERE item_id = ? AND timestamp BETWEEN ? AND ?
+            ORDER BY timestamp
+        ''', (item_id, int(start), int(end)))
+
+        result = cursor.fetchall()
+        conn.close()
+
+        return result
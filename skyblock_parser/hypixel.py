@@ -0,0 +1,228 @@
+import time
+import heapq
+import asyncio
+import itertools
+import aiohttp
+
+from .session import default_session
+from .exceptions import SkyblockParserException
+from .singleflight import SingleFlight
+from .cache import ResponseCache
+
+PRIORITY_HIGH = 0 # someone is waiting on it, e.g. /list
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2 # background refreshes
+
+
+class RateLimiter:
+    """
+    Token bucket matching the key's quota, kept in sync with Hypixel's RateLimit-* headers.
+    Waiting requests are let through by priority, then in arrival order.
+    """
+
+    def __init__(self, limit=300, period=300):
+        self.limit = limit
+        self.period = period
+        self.tokens = limit
+        self.updated = time.monotonic()
+        self.blocked_until = 0
+
+        self.waiters = []
+        self.counter = itertools.count()
+        self.timer = None
+
+    @property
+    def rate(self):
+        return self.limit / self.period
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.limit, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return now
+
+    async def acquire(self, priority=PRIORITY_NORMAL):
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.waiters, (priority, next(self.counter), future))
+        self.dispatch()
+        await future
+
+    def dispatch(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        now = self.refill()
+
+        while self.waiters and self.tokens >= 1 and now >= self.blocked_until:
+            _, _, future = heapq.heappop(self.waiters)
+            if future.done(): # cancelled while queued
+                continue
+            self.tokens -= 1
+            future.set_result(None)
+
+        if self.waiters:
+            delay = max(self.blocked_until - now, (1 - self.tokens) / self.rate, 0)
+            self.timer = asyncio.get_running_loop().call_later(delay, self.dispatch)
+
+    def update(self, headers):
+        try:
+            limit = int(headers["RateLimit-Limit"])
+            remaining = int(headers["RateLimit-Remaining"])
+            reset = int(headers["RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+
+        now = self.refill()
+        if limit > 0:
+            self.limit = limit
+        self.tokens = min(self.tokens, remaining)
+        if remaining <= 0:
+            self.block(reset, now)
+
+    def block(self, seconds, now=None):
+        if now is None:
+            now = self.refill()
+        self.tokens = 0
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+
+class APIKey:
+    def __init__(self, key, limit, period):
+        self.key = key
+        self.limiter = RateLimiter(limit, period)
+        self.disabled_until = 0
+
+        self.requests = 0
+        self.rate_limited = 0
+        self.forbidden = 0
+
+    @property
+    def available(self):
+        return time.monotonic() >= self.disabled_until
+
+    def usage(self):
+        self.limiter.refill()
+        return {
+            "requests": self.requests,
+            "rate_limited": self.rate_limited,
+            "forbidden": self.forbidden,
+            "remaining": int(self.limiter.tokens),
+            "limit": self.limiter.limit,
+            "available": self.available
+        }
+
+
+class HypixelClient:
+    """
+    Every Hypixel API call goes through here: rate limited, identical concurrent requests are only sent once.
+    Several keys can be given, requests go to whichever key has the most quota left.
+    """
+
+    BASE_URL = "https://api.hypixel.net"
+
+    def __init__(self, session:aiohttp.ClientSession=None, api_keys="", limit=300, period=300, retries=3, forbidden_timeout=60, profile_cache:ResponseCache=None):
+        if isinstance(api_keys, str):
+            api_keys = [api_keys]
+
+        self.session = session
+        self.keys = [APIKey(key, limit, period) for key in api_keys]
+        self.retries = retries
+        self.forbidden_timeout = forbidden_timeout
+        self.flights = SingleFlight()
+        self.profile_cache = profile_cache or ResponseCache()
+        self.background = set()
+
+    @property
+    def api_key(self):
+        return self.keys[0].key if self.keys else ""
+
+    def pick_key(self):
+        keys = [key for key in self.keys if key.available]
+        if not keys:
+            raise SkyblockParserException("No usable Hypixel API key")
+
+        for key in keys:
+            key.limiter.refill()
+        # requests already queued on a key will use up its tokens first
+        return max(keys, key=lambda key: (key.limiter.tokens - len(key.limiter.waiters), -key.limiter.blocked_until))
+
+    def usage(self):
+        return {f"{key.key[:8]}...": key.usage() for key in self.keys}
+
+    async def get(self, path, priority=PRIORITY_NORMAL, authenticated=True, **params):
+        key = (path, authenticated, tuple(sorted(params.items())))
+        return await self.flights.do(key, self.request, path, params, priority, authenticated)
+
+    async def request(self, path, params, priority, authenticated):
+        session = self.session or default_session()
+
+        for attempt in range(self.retries + 1):
+            # resources and auctions don't need a key and don't count against it
+            if not authenticated:
+                async with session.get(self.BASE_URL + path, params=params) as response:
+                    return await response.json()
+
+            api_key = self.pick_key()
+            await api_key.limiter.acquire(priority)
+            api_key.requests += 1
+
+            async with session.get(self.BASE_URL + path, params=params, headers={"API-Key": api_key.key}) as response:
+                api_key.limiter.update(response.headers)
+
+                if attempt < self.retries:
+                    if response.status == 429:
+                        api_key.rate_limited += 1
+                        retry_after = response.headers.get("Retry-After") or response.headers.get("RateLimit-Reset") or 1
+                        api_key.limiter.block(int(retry_after))
+                        continue
+
+                    # invalid or revoked key, or a one-off 403 for a single endpoint. Rotate away from it briefly,
+                    # but never take the last usable key out, the caller gets the 403 instead
+                    if response.status == 403:
+                        api_key.forbidden += 1
+                        print(f"Warning: Hypixel API key {api_key.key[:8]}... got HTTP 403 for {path}")
+                        if any(key.available for key in self.keys if key is not api_key):
+                            api_key.disabled_until = time.monotonic() + self.forbidden_timeout
+                            continue
+
+                return await response.json()
+
+    async def get_profiles(self, uuid, priority=PRIORITY_HIGH, force=False):
+        if not force:
+            data, age = await self.profile_cache.get(uuid)
+
+            if data is not None:
+                # stale, but still good enough to show while a fresh copy is fetched
+                if age > self.profile_cache.ttl:
+                    self.revalidate(uuid)
+                return data
+
+        return await self.fetch_profiles(uuid, priority)
+
+    async def fetch_profiles(self, uuid, priority):
+        data = await self.get("/v2/skyblock/profiles", priority, uuid=uuid)
+        if data.get("success"):
+            await self.profile_cache.set(uuid, data)
+        return data
+
+    def revalidate(self, uuid):
+        task = asyncio.ensure_future(self.flights.do(("revalidate", uuid), self.fetch_profiles, uuid, PRIORITY_LOW))
+        self.background.add(task)
+        task.add_done_callback(self.revalidated)
+
+    def revalidated(self, task):
+        self.background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Warning: Could not revalidate profiles: {task.exception()}")
+
+    async def get_museum(self, profile_id, priority=PRIORITY_HIGH):
+        return await self.get("/v2/skyblock/museum", priority, profile=profile_id)
+
+    async def get_auctions(self, page=0, priority=PRIORITY_LOW):
+        return await self.get("/v2/skyblock/auctions", priority, authenticated=False, page=page)
+
+    async def get_ended_auctions(self, priority=PRIORITY_LOW):
+        return await self.get("/v2/skyblock/auctions_ended", priority, authenticated=False)
+
+    async def get_items(self, priority=PRIORITY_LOW):
+        return await self.get("/v2/resources/skyblock/items", priority, authenticated=False)
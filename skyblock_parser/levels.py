@@ -1,3 +1,74 @@
+from bisect import bisect_right
+
+try:
+    import numpy as np
+except ImportError: # only the batch functions need it, pip install listing-bot[batch]
+    np = None
+
+
+class LevelCurve:
+    """
+    Cumulative xp thresholds for consecutive levels, level() bisects them and interpolates within the level
+    """
+
+    def __init__(self, thresholds, start=0, overflow=None, interpolate=True):
+        self.thresholds = list(thresholds)
+        self.start = start
+        self.overflow = overflow # xp per level past the last threshold, None caps the level there
+        self.interpolate = interpolate
+
+        self.max_level = start + len(self.thresholds) - 1
+        self.max_exp = self.thresholds[-1]
+        self.array = None
+
+    @classmethod
+    def from_table(cls, table, max_level=None, **kwargs):
+        levels = sorted(int(level) for level in table if max_level is None or int(level) <= max_level)
+        return cls([table[str(level)] for level in levels], levels[0], **kwargs)
+
+    def level(self, exp):
+        if exp >= self.max_exp:
+            if self.overflow:
+                return self.max_level + (exp - self.max_exp) / self.overflow
+            return self.max_level
+
+        index = bisect_right(self.thresholds, exp)
+        if not self.interpolate:
+            return self.start + index - 1
+
+        # below the first threshold, extrapolate from the first level
+        index = max(index, 1)
+        lowexp = self.thresholds[index - 1]
+        highexp = self.thresholds[index]
+        return (self.start + index - 1) + (exp - lowexp) / (highexp - lowexp)
+
+    def levels(self, exps):
+        """
+        level() over an array of xp in one go, returns a float array with the same results
+        """
+        if np is None:
+            raise ImportError("numpy is required for batch level calculations")
+
+        if self.array is None:
+            self.array = np.array(self.thresholds, dtype=np.float64)
+
+        exps = np.asarray(exps, dtype=np.float64)
+        capped = exps >= self.max_exp
+        index = np.searchsorted(self.array, exps, side="right")
+
+        if not self.interpolate:
+            return np.where(capped, self.max_level, self.start + index - 1).astype(np.float64)
+
+        index = np.clip(index, 1, len(self.array) - 1)
+        lowexp = self.array[index - 1]
+        highexp = self.array[index]
+        levels = (self.start + index - 1) + (exps - lowexp) / (highexp - lowexp)
+
+        if self.overflow:
+            return np.where(capped, self.max_level + (exps - self.max_exp) / self.overflow, levels)
+        return np.where(capped, self.max_level, levels)
+
+
 cata_levels = {
         "1": 50, "2": 125, "3": 235, "4": 395, "5": 625, "6": 955, "7": 1425, "8": 2095, "9": 3045,
         "10": 4385, "11": 6275, "12": 8940, "13": 12700, "14": 17960, "15": 25340, "16": 35640,
@@ -9,23 +80,13 @@ cata_levels = {
         "47": 285559640, "48": 360559640, "49": 453559640, "50": 569809640
 }
 
-def get_cata_lvl(exp):
-    for level in cata_levels:
-        if exp >= cata_levels['50']:
-            xp_above_50 = exp - cata_levels['50']
-            levels = xp_above_50 / 200000000
-            return 50 + levels
+CATA_CURVE = LevelCurve.from_table(cata_levels, overflow=200000000)
 
+def get_cata_lvl(exp):
+    return CATA_CURVE.level(exp)
 
-        if cata_levels[level] > exp:
-            if int(level) == 1:
-                level = str(2)
-            lowexp = cata_levels[str(int(level) - 1)]
-            highexp = cata_levels[level]
-            difference = highexp - lowexp
-            extra = exp - lowexp
-            percentage = (extra / difference)
-            return (int(level) - 1) + percentage
+def get_cata_lvls(exps):
+    return CATA_CURVE.levels(exps)
 
 
 SKILL_MAX_LEVELS = {
@@ -79,18 +140,16 @@ SKILL_MAX_LEVELS = {
 }
 
 
+hotm_levels = {
+    "1": 0, "2": 3000, "3": 12000, "4": 37000, "5": 97000, "6": 197000, "7": 347000, "8": 557000, "9": 847000, "10": 1247000
+}
+HOTM_CURVE = LevelCurve.from_table(hotm_levels, interpolate=False)
+
 def get_hotm_level(exp):
-    levels = {
-        "1": 0, "2": 3000, "3": 12000, "4": 37000, "5": 97000, "6": 197000, "7": 347000, "8": 557000, "9": 847000, "10": 1247000
-    }
-    for level in levels:
-        if exp >= levels['10']:
-            return 10
-        
-        if levels[level] > exp:
-            return int(level) - 1
-        
-    return 10
+    return HOTM_CURVE.level(exp)
+
+def get_hotm_levels(exps):
+    return HOTM_CURVE.levels(exps)
 
 revenant = {"0": 0, "1": 5, "2": 15, "3": 200, "4": 1000,
         "5": 5000, "6": 20000, "7": 100000, "8": 400000, "9": 1000000}
@@ -106,36 +165,20 @@ vampire = {"0": 0, "1": 20, "2": 75, "3": 240, "4": 840, "5": 2400}
 
 
         
+SLAYER_CURVES = {
+    "zombie": LevelCurve.from_table(revenant),
+    "spider": LevelCurve.from_table(spider),
+    "wolf": LevelCurve.from_table(sven),
+    "enderman": LevelCurve.from_table(enderman),
+    "blaze": LevelCurve.from_table(blaze),
+    "vampire": LevelCurve.from_table(vampire)
+}
+
 def get_slayer_level(slayer_type, exp):
+    return SLAYER_CURVES[slayer_type].level(exp)
 
-    if slayer_type == "zombie":
-        levels = revenant
-    elif slayer_type == "spider":
-        levels = spider
-    elif slayer_type == "wolf":
-        levels = sven
-    elif slayer_type == "enderman":
-        levels = enderman
-    elif slayer_type == "blaze":
-        levels = blaze
-    elif slayer_type == "vampire":
-        levels = vampire
-
-    for level in levels:
-        try:
-            if exp >= levels['9']:
-                return 9
-        except:
-            if exp >= levels['5']:
-                return 5
-
-        if levels.get(level) > exp:
-            lowexp = levels[str(int(level) - 1)]
-            highexp = levels.get(level)
-            difference = highexp - lowexp
-            extra = exp - lowexp
-            percentage = (extra / difference)
-            return (int(level) - 1) + percentage
+def get_slayer_levels(slayer_type, exps):
+    return SLAYER_CURVES[slayer_type].levels(exps)
 
 
 skill_levels = {
@@ -159,44 +202,18 @@ social_levels = {
     "10": 7550, "11": 10050, "12": 13050, "13": 16800, "14": 21300, "15": 27300, "16": 35300, "17": 45300,
     "18": 57800, "19": 72800, "20": 92800, "21": 117800, "22": 147800, "23": 182800, "24": 222800, "25": 272800
 }
+SKILL_CURVES = {
+    skill: LevelCurve.from_table(skill_levels, data['maxLevel'])
+    for skill, data in SKILL_MAX_LEVELS.items()
+}
+SKILL_CURVES["runecrafting"] = LevelCurve.from_table(runecrafting_levels)
+SKILL_CURVES["social"] = LevelCurve.from_table(social_levels)
+
 def get_skill_lvl(skill_type, exp):
-    if skill_type == "runecrafting":
-        for level in runecrafting_levels:
-            if exp >= 94400:
-                return 25
-
-            if runecrafting_levels[level] > exp:
-                lowexp = runecrafting_levels[str(int(level) - 1)]
-                highexp = runecrafting_levels[level]
-                difference = highexp - lowexp
-                extra = exp - lowexp
-                percentage = (extra / difference)
-                return (int(level) - 1) + percentage
-            
-    if skill_type == "social":
-        for level in social_levels:
-            if exp >= 272800:
-                return 25
-
-            if social_levels[level] > exp:
-                lowexp = social_levels[str(int(level) - 1)]
-                highexp = social_levels[level]
-                difference = highexp - lowexp
-                extra = exp - lowexp
-                percentage = (extra / difference)
-                return (int(level) - 1) + percentage
-            
-    for level in skill_levels:
-        if exp >= skill_levels[str(SKILL_MAX_LEVELS[skill_type]['maxLevel'])]:
-            return SKILL_MAX_LEVELS[skill_type]['maxLevel']
-
-        if skill_levels[level] > exp:
-            lowexp = skill_levels[str(int(level) - 1)]
-            highexp = skill_levels[level]
-            difference = highexp - lowexp
-            extra = exp - lowexp
-            percentage = (extra / difference)
-            return (int(level) - 1) + percentage
+    return SKILL_CURVES[skill_type].level(exp)
+
+def get_skill_lvls(skill_type, exps):
+    return SKILL_CURVES[skill_type].levels(exps)
         
 
 garden_levels = {
@@ -204,18 +221,10 @@ garden_levels = {
     "11": 20120, "12": 30120, "13": 40120, "14": 50120, "15": 60120
 }
 
+GARDEN_CURVE = LevelCurve.from_table(garden_levels)
+
 def get_garden_lvl(exp):
-    for level in garden_levels:
-
-        if exp >= garden_levels['15']:
-            return 15
-
-        if garden_levels[level] > exp:
-            lowexp = garden_levels[str(int(level) - 1)]
-            highexp = garden_levels[level]
-            difference = highexp - lowexp
-            extra = exp - lowexp
-            percentage = (extra / difference)
-            return (int(level) - 1) + percentage
-        
-    return 0
+    return GARDEN_CURVE.level(exp)
+
+def get_garden_lvls(exps):
+    return GARDEN_CURVE.levels(exps)
@@ -0,0 +1,83 @@
+from collections import namedtuple
+from functools import lru_cache
+
+text_colors = {"0": ["black", (0, 0, 0)], "1": ["dark blue", (0, 0, 170)], "2": ["dark green", (0, 170, 0)], "3": ["dark aqua", (0, 170, 170)], "4": ["dark red", (170, 0, 0)], "5": ["dark purple", (170, 0, 170)], "6": ["gold", (255, 170, 0)], "7": ["gray", (170, 170, 170)], "8": [
+                               "dark_gray", (85, 85, 85)], "9": ["blue", (85, 85, 255)], "a": ["green", (85, 255, 85)], "b": ["aqua", (85, 255, 255)], "c": ["red", (255, 85, 85)], "d": ["light purple", (255, 85, 255)], "e": ["yellow", (255, 255, 85)], "f": ["white", (255, 255, 255)]}
+shadow_colors = {"0": ["black", (0, 0, 0)], "1": ["dark blue", (0, 0, 42)], "2": ["dark green", (0, 42, 0)], "3": ["dark aqua", (0, 42, 42)], "4": ["dark red", (42, 0, 0)], "5": ["dark purple", (42, 0, 42)], "6": ["gold", (42, 42, 0)], "7": ["gray", (42, 42, 42)], "8": [
+                                 "dark_gray", (21, 21, 21)], "9": ["blue", (21, 21, 63)], "a": ["green", (21, 63, 21)], "b": ["aqua", (21, 63, 63)], "c": ["red", (63, 21, 21)], "d": ["light purple", (63, 21, 63)], "e": ["yellow", (63, 63, 21)], "f": ["white", (63, 63, 63)]}
+
+# Hypixel sends §, the bot rewrites it to & in most places, both start a formatting code
+FORMAT_MARKERS = "&§"
+VARIATION_SELECTOR = "️"
+
+
+class LoreRun(namedtuple("LoreRun", ["text", "color", "shadow_color", "bold", "italic", "special"])):
+    """
+    Consecutive characters of a lore line drawn with the same style
+    """
+
+    __slots__ = ()
+
+    @property
+    def font(self):
+        if self.special:
+            return "unicode"
+        if self.italic:
+            return "bold_italic" if self.bold else "italic"
+        return "bold" if self.bold else "regular"
+
+
+@lru_cache(maxsize=16384)
+def tokenize(line):
+    """
+    Turns a formatted line into a tuple of LoreRuns, lines repeat a lot across items so results are memoized
+    """
+    runs = []
+    text = []
+    style = None
+
+    code_character = False
+    bolded = False
+    italics = False
+    shadow_color = (63, 63, 63)
+    color = (255, 255, 255)
+
+    for char in line:
+        if char == VARIATION_SELECTOR:
+            continue
+        elif char in FORMAT_MARKERS:
+            code_character = True
+        elif code_character is True:
+            code_character = False
+            if char in text_colors:
+                color = text_colors[char][1]
+                shadow_color = shadow_colors[char][1]
+            elif char == "r":
+                color = (255, 255, 255)
+                italics = False
+                bolded = False
+            elif char == "l":
+                bolded = True
+            elif char == "o":
+                italics = True
+        else:
+            char_style = (color, shadow_color, bolded, italics, ord(char) > 127)
+            if char_style != style:
+                if text:
+                    runs.append(LoreRun("".join(text), *style))
+                text = []
+                style = char_style
+            text.append(char)
+
+    if text:
+        runs.append(LoreRun("".join(text), *style))
+
+    return tuple(runs)
+
+
+def plain_text(line):
+    """
+    The text of a formatted line or of its LoreRuns, without formatting codes
+    """
+    runs = line if isinstance(line, tuple) else tokenize(line)
+    return "".join(run.text for run in runs)
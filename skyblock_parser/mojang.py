@@ -0,0 +1,193 @@
+import os
+import time
+import sqlite3
+import asyncio
+import aiohttp
+
+from .cache import LRU
+from .session import default_session
+from .singleflight import SingleFlight
+
+BULK_URL = "https://api.minecraftservices.com/minecraft/profile/lookup/bulk/byname"
+PROFILE_URL = "https://sessionserver.mojang.com/session/minecraft/profile/{}"
+BULK_LIMIT = 10 # names per bulk request, Mojang's limit
+
+
+class MojangResolver:
+    """
+    uuid <-> username lookups behind an in-memory LRU and a SQLite table.
+    Players that don't exist are cached too, for a shorter time.
+    """
+
+    def __init__(self, db_path="./database/mojang.db", session:aiohttp.ClientSession=None, max_size=5000, ttl=86400, negative_ttl=3600, concurrency=8):
+        self.db_path = db_path
+        self.session = session
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.flights = SingleFlight()
+
+        self.entries = LRU(max_size)
+        self.database_ready = False
+
+    def init_database(self):
+        if self.database_ready:
+            return
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS lookups (
+                kind TEXT NOT NULL,
+                lookup_key TEXT NOT NULL,
+                value TEXT,
+                fetched_at INTEGER NOT NULL,
+                PRIMARY KEY (kind, lookup_key)
+            )
+        ''')
+
+        conn.commit()
+        conn.close()
+        self.database_ready = True
+
+    def get_db_connection(self):
+        self.init_database()
+        return sqlite3.connect(self.db_path)
+
+    async def cached(self, kind, keys):
+        """
+        Returns {key: value} for everything cached and not expired, value is None for known missing players
+        """
+        now = time.time()
+        found = {}
+        missing = []
+
+        for key in keys:
+            entry = self.entries.get((kind, key))
+            if entry is not None and not self.expired(entry, now):
+                found[key] = entry[0]
+            else:
+                missing.append(key)
+
+        if missing:
+            rows = await asyncio.get_running_loop().run_in_executor(None, self.load, kind, missing)
+            for key, value, fetched_at in rows:
+                if not self.expired((value, fetched_at), now):
+                    self.remember(kind, key, value, fetched_at)
+                    found[key] = value
+
+        return found
+
+    def load(self, kind, keys):
+        conn = self.get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(f'''
+            SELECT lookup_key, value, fetched_at FROM lookups
+            WHERE kind = ? AND lookup_key IN ({", ".join("?" * len(keys))})
+        ''', (kind, *keys))
+
+        rows = cursor.fetchall()
+        conn.close()
+        return rows
+
+    def expired(self, entry, now):
+        value, fetched_at = entry
+        return now - fetched_at > (self.ttl if value is not None else self.negative_ttl)
+
+    def remember(self, kind, key, value, fetched_at):
+        self.entries.set((kind, key), (value, fetched_at))
+
+    async def store(self, kind, results):
+        now = int(time.time())
+        for key, value in results.items():
+            self.remember(kind, key, value, now)
+
+        rows = [(kind, key, value, now) for key, value in results.items()]
+        await asyncio.get_running_loop().run_in_executor(None, self.save, rows)
+
+    def save(self, rows):
+        conn = self.get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.executemany('''
+            INSERT OR REPLACE INTO lookups (kind, lookup_key, value, fetched_at)
+            VALUES (?, ?, ?, ?)
+        ''', rows)
+
+        conn.commit()
+        conn.close()
+
+    async def get_uuids(self, names, session:aiohttp.ClientSession=None):
+        """
+        Returns {name: uuid or None}, uncached names are looked up through the bulk endpoint
+        """
+        keys = {name.lower(): name for name in names}
+        found = await self.cached("name", list(keys))
+
+        missing = [key for key in keys if key not in found]
+        chunks = [missing[i:i + BULK_LIMIT] for i in range(0, len(missing), BULK_LIMIT)]
+        for results in await asyncio.gather(*[self.fetch_uuids(chunk, session) for chunk in chunks]):
+            found.update(results)
+
+        return {keys[key]: found.get(key) for key in keys}
+
+    async def fetch_uuids(self, names, session=None):
+        session = session or self.session or default_session()
+
+        async with self.semaphore:
+            async with session.post(BULK_URL, json=names) as response:
+                if response.status != 200:
+                    raise RuntimeError(f"Failed to get UUIDs, HTTP {response.status}")
+                data = await response.json()
+
+        results = {name: None for name in names}
+        for player in data:
+            results[player['name'].lower()] = player['id']
+
+        await self.store("name", results)
+        await self.store("uuid", {player['id']: player['name'] for player in data})
+        return results
+
+    async def get_names(self, uuids, session:aiohttp.ClientSession=None):
+        """
+        Returns {uuid: username or None}, uncached uuids are looked up concurrently.
+        A failed lookup (429, 5xx, network) gives None for that uuid only and isn't cached
+        """
+        uuids = [uuid.replace("-", "") for uuid in uuids]
+        found = await self.cached("uuid", uuids)
+
+        missing = [uuid for uuid in uuids if uuid not in found]
+        names = await asyncio.gather(*[self.flights.do(uuid, self.fetch_name, uuid, session) for uuid in missing], return_exceptions=True)
+        for uuid, name in zip(missing, names):
+            if isinstance(name, Exception):
+                print(f"Warning: Could not get username for {uuid}: {name}")
+                continue
+            found[uuid] = name
+
+        return {uuid: found.get(uuid) for uuid in uuids}
+
+    async def fetch_name(self, uuid, session=None):
+        session = session or self.session or default_session()
+
+        async with self.semaphore:
+            async with session.get(PROFILE_URL.format(uuid)) as response:
+                if response.status == 200:
+                    name = (await response.json()).get("name")
+                elif response.status in (204, 404):
+                    name = None
+                else:
+                    raise RuntimeError(f"Failed to get username, HTTP {response.status}")
+
+        await self.store("uuid", {uuid: name})
+        if name is not None:
+            await self.store("name", {name.lower(): uuid})
+        return name
+
+
+mojang_resolver = MojangResolver()
@@ -0,0 +1,286 @@
+import re
+
+from .cache import item_value_cache
+
+# how much of an upgrade's price carries over once it has been applied to an item
+APPLICATION_WORTH = {
+    "enchantments": 0.85,
+    "hot_potato_book": 1,
+    "fuming_potato_book": 0.6,
+    "recombobulator": 0.8,
+    "pet_item": 1,
+    "pet_skin": 0.8,
+    "pet_candy": 0.65,
+    "essence": 0.75,
+    "master_star": 1,
+    "gemstone": 1,
+    "reforge": 1,
+    "dye": 0.9,
+}
+
+# reforge (ExtraAttributes.modifier) -> the stone that applies it, basic reforges from the blacksmith cost nothing
+REFORGE_STONES = {
+    "ancient": "PRECURSOR_GEAR",
+    "auspicious": "ROCK_GEMSTONE",
+    "blessed": "BLESSED_FRUIT",
+    "bulky": "BULKY_STONE",
+    "bustling": "SKYMART_BROCHURE",
+    "dirty": "DIRT_BOTTLE",
+    "empowered": "SADAN_BROOCH",
+    "fabled": "DRAGON_CLAW",
+    "fleet": "DIAMONITE",
+    "fruitful": "ONYX",
+    "giant": "GIANT_TOOTH",
+    "gilded": "MIDAS_JEWEL",
+    "jaded": "JADERALD",
+    "moil": "MOIL_LOG",
+    "mossy": "OVERGROWN_GRASS",
+    "necrotic": "NECROMANCER_BROOCH",
+    "perfect": "DIAMOND_ATOM",
+    "precise": "OPTICAL_LENS",
+    "pure": "PURE_MITHRIL",
+    "renowned": "DRAGON_HORN",
+    "spiritual": "SPIRIT_DECOY",
+    "submerged": "DEEP_SEA_ORB",
+    "toil": "TOIL_LOG",
+    "treacherous": "RUSTY_ANCHOR",
+    "warped": "WARPED_STONE",
+    "withered": "WITHER_BLOOD",
+}
+
+MASTER_STARS = ["first_master_star", "second_master_star", "third_master_star", "fourth_master_star", "fifth_master_star"]
+
+# gem slots that take any gemstone of their group store the gemstone type under "<slot>_gem"
+GEMSTONE_GROUPS = ("COMBAT", "OFFENSIVE", "DEFENSIVE", "UNIVERSAL", "MINING", "CHISEL")
+
+# category name -> Profile attribute holding the decoded items
+ITEM_CATEGORIES = {
+    "armor": "inv_armor",
+    "equipment": "equipment",
+    "wardrobe": "wardrobe",
+    "inventory": "inv",
+    "enderchest": "ender_chest",
+    "accessories": "talisman_bag",
+    "personal_vault": "personal_vault",
+    "fishing_bag": "fishing_bag",
+    "potion_bag": "potion_bag",
+    "quiver": "quiver",
+    "sacks_bag": "sacks_bag",
+}
+
+formatting_codes = re.compile("[&§].")
+
+
+def clean_name(name):
+    return formatting_codes.sub("", name)
+
+
+class NetworthCalculator:
+    """
+    In-process networth using decoded Items/Pets and a prices mapping, e.g. AuctionHouseParser.prices
+
+    Not valued yet, unlike skyhelper-networth: gemstone slot unlocks, enrichments, power scrolls,
+    runes, drill parts, art of war/peace, wood singularity and transmission tuners
+    """
+
+    def __init__(self, prices, price_version=None, upgrade_costs=None):
+        self.prices = prices
+        self.price_version = price_version
+        # item id -> upgrade_costs from /resources/skyblock/items, one list of costs per star
+        self.upgrade_costs = upgrade_costs or {}
+
+    def price(self, item_id):
+        return self.prices.get(item_id.lower(), 0)
+
+    def fingerprint(self, item):
+        # everything item_value() reads, an item with the same uuid but new upgrades gets revalued
+        return (
+            item._id,
+            item.count,
+            item.hot_potato_count,
+            item.rarity_upgrades,
+            tuple(sorted(item.enchantments.items())),
+            item.reforge,
+            item.stars,
+            repr(sorted(item.gems.items())),
+            item.dye
+        )
+
+    def item_value(self, item):
+        # without a snapshot version there is no telling when a memoized value goes stale
+        if not item.item_uuid or self.price_version is None:
+            return self.compute_item_value(item)
+
+        key = (item.item_uuid, self.fingerprint(item))
+        value = item_value_cache.get(key, self.price_version)
+        if value is None:
+            value = self.compute_item_value(item)
+            item_value_cache.set(key, value, self.price_version)
+        return value
+
+    def compute_item_value(self, item):
+        value = self.price(item._id) * item.count
+
+        for enchantment, level in item.enchantments.items():
+            if item._id == "ENCHANTED_BOOK" and len(item.enchantments) == 1:
+                value = max(value, self.price(f"enchantment_{enchantment}_{level}"))
+            else:
+                value += self.price(f"enchantment_{enchantment}_{level}") * APPLICATION_WORTH["enchantments"]
+
+        if item.hot_potato_count:
+            hot_potato_books = min(item.hot_potato_count, 10)
+            fuming_potato_books = item.hot_potato_count - hot_potato_books
+            value += self.price("hot_potato_book") * hot_potato_books * APPLICATION_WORTH["hot_potato_book"]
+            value += self.price("fuming_potato_book") * fuming_potato_books * APPLICATION_WORTH["fuming_potato_book"]
+
+        if item.rarity_upgrades:
+            value += self.price("recombobulator_3000") * APPLICATION_WORTH["recombobulator"]
+
+        if item.stars:
+            value += self.stars_value(item)
+
+        if item.gems:
+            value += self.gemstones_value(item.gems)
+
+        if item.reforge in REFORGE_STONES:
+            value += self.price(REFORGE_STONES[item.reforge]) * APPLICATION_WORTH["reforge"]
+
+        if item.dye:
+            value += self.price(item.dye) * APPLICATION_WORTH["dye"]
+
+        return value
+
+    def stars_value(self, item):
+        value = 0
+        for costs in self.upgrade_costs.get(item._id, [])[:item.stars]:
+            for cost in costs:
+                if cost.get("type") == "ESSENCE":
+                    value += self.price(f"essence_{cost['essence_type']}") * cost.get("amount", 0) * APPLICATION_WORTH["essence"]
+                elif cost.get("type") == "ITEM":
+                    value += self.price(cost["item_id"]) * cost.get("amount", 1) * APPLICATION_WORTH["essence"]
+
+        # dungeon items go past 5 stars with master stars, consumed in order
+        for star in MASTER_STARS[:max(item.stars - 5, 0)]:
+            value += self.price(star) * APPLICATION_WORTH["master_star"]
+
+        return value
+
+    def gemstones_value(self, gems):
+        value = 0
+        for slot, quality in gems.items():
+            if slot == "unlocked_slots" or slot.endswith("_gem"):
+                continue
+
+            if isinstance(quality, dict):
+                quality = quality.get("quality")
+            if not isinstance(quality, str):
+                continue
+
+            group = slot.split("_")[0]
+            gemstone = gems.get(f"{slot}_gem") if group in GEMSTONE_GROUPS else group
+            if gemstone:
+                value += self.price(f"{quality}_{gemstone}_gem") * APPLICATION_WORTH["gemstone"]
+
+        return value
+
+    def pet_value(self, pet):
+        tier = str(pet.tier).lower()
+        pet_type = pet.type.lower()
+
+        low = self.price(f"lvl_1_{tier}_{pet_type}")
+        high = self.price(f"lvl_100_{tier}_{pet_type}") or low
+
+        if pet.level > 100 and self.price(f"lvl_200_{tier}_{pet_type}"):
+            low = high
+            high = self.price(f"lvl_200_{tier}_{pet_type}")
+            progress = (pet.level - 100) / 100
+        else:
+            progress = (min(pet.level, 100) - 1) / 99
+
+        value = low + (high - low) * progress
+
+        if pet.candy_used and pet.level < 100:
+            value *= APPLICATION_WORTH["pet_candy"]
+
+        if pet.held_item:
+            value += self.price(pet.held_item) * APPLICATION_WORTH["pet_item"]
+
+        if pet.skin:
+            value += self.price(f"pet_skin_{pet.skin}") * APPLICATION_WORTH["pet_skin"]
+
+        return value
+
+    def category(self, entries):
+        items = []
+        total = 0
+        unsoulbound_total = 0
+
+        for name, item_id, count, price, soulbound in entries:
+            if price <= 0:
+                continue
+
+            items.append({
+                "name": name,
+                "id": item_id,
+                "count": count,
+                "price": price,
+                "soulbound": soulbound
+            })
+            total += price
+            if not soulbound:
+                unsoulbound_total += price
+
+        items.sort(key=lambda x: x['price'], reverse=True)
+        return {"total": total, "unsoulboundTotal": unsoulbound_total, "items": items}
+
+    def item_entries(self, items):
+        for item in items:
+            if not item._id:
+                continue
+            yield clean_name(item.raw_lore[0]) if item.raw_lore else item._id, item._id, item.count, self.item_value(item), item.soulbound
+
+    def calculate(self, profile):
+        types = {}
+
+        for name, attribute in ITEM_CATEGORIES.items():
+            types[name] = self.category(self.item_entries(getattr(profile, attribute, [])))
+
+        storage = []
+        for section, items in profile.items.items():
+            if section.startswith("backpack_"):
+                storage.extend(items)
+        types["storage"] = self.category(self.item_entries(storage))
+
+        types["museum"] = self.category(self.item_entries(profile.museum_items))
+
+        types["pets"] = self.category(
+            (f"[Lvl {int(pet.level)}] {pet.type.replace('_', ' ').title()}", pet.type, 1, self.pet_value(pet), False)
+            for pet in profile.pets
+        )
+
+        types["sacks"] = self.category(
+            (item_id, item_id, count, self.price(item_id) * count, False)
+            for item_id, count in getattr(profile, "sacks", {}).items()
+        )
+
+        essence = profile.currencies.get("essence", {})
+        types["essence"] = self.category(
+            (f"{name.title()} Essence", f"ESSENCE_{name}", data.get("current", 0),
+             self.price(f"essence_{name}") * data.get("current", 0), False)
+            for name, data in essence.items()
+        )
+
+        purse = profile.currencies.get("coin_purse", 0)
+        personal_bank = profile.profile_data_user.get("profile", {}).get("bank_account", 0)
+        coins = purse + profile.bank_balance + personal_bank
+        networth = coins + sum(x['total'] for x in types.values())
+        unsoulbound_networth = coins + sum(x['unsoulboundTotal'] for x in types.values())
+
+        return {
+            "networth": networth,
+            "unsoulboundNetworth": unsoulbound_networth,
+            "purse": purse,
+            "bank": profile.bank_balance,
+            "personalBank": personal_bank,
+            "types": types
+        }
@@ -1,6 +1,10 @@
 from skyblock_parser.constants import *
 from skyblock_parser.exceptions import SkyblockParserException
-from skyblock_parser.renderer import render
+from skyblock_parser.renderer import render, render_async
+from skyblock_parser.lore import tokenize, plain_text
+from functools import lru_cache
+from itertools import accumulate
+from bisect import bisect_right
 
 def format_stat(stat):
     formatted_stat = "{:.2f}".format(stat).rstrip("0").rstrip(".")
@@ -18,10 +22,24 @@ rarity_colors = {
     "MYTHIC": "d"
 }
 
+@lru_cache(maxsize=None)
+def cumulative_pet_xp(offset, max_level):
+    """
+    Running xp totals from level 1, one table per rarity offset and max level
+    """
+    return tuple(accumulate(pet_levels[offset:offset + max_level - 1]))
+
+
 class Pet:
+    __slots__ = (
+        "raw_lore", "_lore", "uuid", "active", "type", "exp", "tier", "rarity_color",
+        "held_item", "candy_used", "skin", "max_level", "level", "max_xp"
+    )
+
     def __init__(self, data, menu:bool=True):
 
-        self.lore = []
+        self.raw_lore = ()
+        self._lore = None
         self.uuid = None
         self.active = False
 
@@ -30,12 +48,7 @@ class Pet:
             item_name = data.get("display", {}).get("Name", "")
             item_lore = data.get("display", {}).get("Lore", [])
 
-            lore = [item_name, *item_lore]
-            for line in lore:
-                if "§r §e" in line:
-                    line = line.split(" §r ")[1]
-                line = line.replace("§", "&")
-                self.lore.append(line)
+            self.raw_lore = (item_name, *item_lore)
 
 
         if self.uuid is None:
@@ -81,29 +94,43 @@ class Pet:
         else:
             pet_offset = rarity_offset[self.tier]
 
-        new_pet_levels = pet_levels[pet_offset:]
-        new_pet_levels = new_pet_levels[:self.max_level-1]
+        cumulative = cumulative_pet_xp(pet_offset, self.max_level)
 
-        total_pet_xp = 0
+        # cumulative[i] is the total xp to reach level i + 2
+        index = bisect_right(cumulative, self.exp)
+        self.level = index + 1 if index < len(cumulative) else self.max_level
+        self.max_xp = cumulative[-1] if cumulative else 0
 
-        for i in new_pet_levels:
-            total_pet_xp += i
-            if total_pet_xp >= self.exp:
-                level = new_pet_levels.index(i)+1
-                break
-        else:
-            level = 100
-            if self.type in special_pet_levels:
-                level = special_pet_levels[self.type]
 
-        self.level = level
-        self.max_xp = sum(new_pet_levels)
+    @property
+    def lore(self):
+        if self._lore is None:
+            self._lore = []
+            for line in self.raw_lore:
+                if "§r §e" in line:
+                    line = line.split(" §r ")[1]
+                line = line.replace("§", "&")
+                self._lore.append(line)
+        return self._lore
+
+    @property
+    def lore_runs(self):
+        """
+        LoreRuns per line, from the shared memoized tokenizer
+        """
+        return [tokenize(line) for line in self.lore]
 
+    @property
+    def plain_lore(self):
+        return [plain_text(line) for line in self.lore_runs]
 
     def create_lore(self):
-        if self.lore is not []:
+        if self.raw_lore:
             return
             
     def render(self):
-        return render(self.lore)
+        return render(self.lore_runs)
+
+    async def render_async(self):
+        return await render_async(self.lore_runs)
 
@@ -0,0 +1,76 @@
+import heapq
+import json
+
+from .pets import Pet
+from .exceptions import SkyblockParserException
+
+
+def price_key(attributes):
+    """
+    Key the networth engine looks prices up by, pets and single enchantment books get their own keys
+    """
+    item_id = attributes.get("id", "")
+
+    if item_id == "PET" and attributes.get("petInfo"):
+        # an unknown tier or malformed petInfo keeps the listing under the plain id
+        try:
+            pet = Pet(json.loads(attributes['petInfo']))
+            return f"lvl_{int(pet.level)}_{pet.tier}_{pet.type}".lower()
+        except (KeyError, ValueError, TypeError, SkyblockParserException):
+            return item_id.lower()
+
+    enchantments = attributes.get("enchantments", {})
+    if item_id == "ENCHANTED_BOOK" and len(enchantments) == 1:
+        name, level = next(iter(enchantments.items()))
+        return f"enchantment_{name}_{level}".lower()
+
+    return item_id.lower()
+
+
+class PriceEngine:
+    """
+    Reference prices computed from our own BIN snapshot
+    """
+
+    def __init__(self, depth=20, percentile=0.2, trim=3):
+        self.depth = depth
+        self.percentile = percentile
+        self.trim = trim
+
+        self.prices = {}
+        self._signatures = {}
+
+    def update(self, auctions):
+        listings = {}
+        for auction in auctions:
+            listings.setdefault(auction.get('price_key', auction['id']), []).append(auction['price'])
+
+        changed = 0
+        for item_id, prices in listings.items():
+            cheapest = tuple(heapq.nsmallest(self.depth, prices))
+
+            # same cheapest listings as last refresh, nothing to recompute
+            if self._signatures.get(item_id) == cheapest:
+                continue
+
+            self._signatures[item_id] = cheapest
+            self.prices[item_id.lower()] = self.reference_price(cheapest)
+            changed += 1
+
+        # items that sold out keep their last price, but get recomputed once relisted
+        for item_id in list(self._signatures):
+            if item_id not in listings:
+                del self._signatures[item_id]
+
+        return changed
+
+    def reference_price(self, cheapest):
+        median = cheapest[len(cheapest) // 2]
+
+        # drop listings far below the rest, those get sniped before anyone can buy them
+        kept = [price for price in cheapest if price * self.trim >= median]
+
+        position = self.percentile * (len(kept) - 1)
+        low = int(position)
+        high = min(low + 1, len(kept) - 1)
+        return kept[low] + (kept[high] - kept[low]) * (position - low)
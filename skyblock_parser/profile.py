@@ -1,14 +1,71 @@
 from skyblock_parser.exceptions import *
 from skyblock_parser.constants import *
 from skyblock_parser.levels import *
-from skyblock_parser.renderer import render
+from skyblock_parser.renderer import render, render_async
+from skyblock_parser.lore import tokenize, plain_text
 from skyblock_parser.pets import Pet
+from skyblock_parser.networth import NetworthCalculator
+from skyblock_parser.cache import networth_cache, NETWORTH_SECTIONS
+from skyblock_parser.session import default_session, close_default_session
+from skyblock_parser.hypixel import HypixelClient
+from skyblock_parser.mojang import mojang_resolver
+from skyblock_parser.singleflight import SingleFlight
+from skyblock_parser.executor import cpu_executor
 import gzip
+import json
 import base64
+from functools import cached_property
 import struct
 import asyncio
 import aiohttp
 
+NETWORTH_URL = "http://localhost:5000/networth"
+NETWORTH_BATCH_URL = "http://localhost:5000/networth/batch"
+
+# concurrent get_json() calls for the same player and profile share one build
+profile_flights = SingleFlight()
+
+# get_json() key -> Profile attribute, sections are only computed when selected
+JSON_FIELDS = {
+    "profile_id": "profile_id",
+    "uuid": "uuid",
+    "cute_name": "cute_name",
+    "profile_type": "profile_type",
+    "bank_balance": "bank_balance",
+    "created_at": "created_at",
+    "skyblock_level": "skyblock_level",
+    "collections": "collections",
+    "bestiary": "bestiary",
+    "nether": "nether",
+    "currencies": "currencies",
+    "networth": "networth_data",
+    "dungeons": "dungeon_data",
+    "slayers": "slayer_data",
+    "skills": "skill_data",
+    "mining": "mining_data",
+    "general": "general_stats",
+    "farming": "farming_data",
+    "coop_names": "coop_names",
+    "coop_count": "coop_count",
+    "rift": "rift",
+    "events": "events"
+}
+
+
+def check_fields(fields):
+    unknown = [field for field in fields if field not in JSON_FIELDS]
+    if unknown:
+        raise SkyblockParserException(f"Unknown field(s): {', '.join(unknown)}")
+
+
+async def post_networth(url, body, session=None):
+    data = gzip.compress(json.dumps(body, separators=(",", ":")).encode(), compresslevel=1)
+    async with (session or default_session()).post(url, data=data, headers={
+        "Content-Type": "application/json",
+        "Content-Encoding": "gzip"
+    }) as response:
+        return await response.json()
+
 def TAG_End(b):
     return None, b
 
@@ -124,35 +181,376 @@ def decode_item(nbt):
     return data
 
 
+def compute_dungeon_data(member):
+    experience = member.get("dungeons", {}).get(
+        "dungeon_types", {}).get("catacombs", {}).get("experience", 0)
+    level = get_cata_lvl(experience)
+
+    classes = [
+        "healer",
+        "mage",
+        "berserk",
+        "archer",
+        "tank"
+    ]
+
+    class_data = {_class: {} for _class in classes}
+
+    for d_class in classes:
+        d_class_data = member.get("dungeons", {}).get(
+            "player_classes", {}).get(d_class, {})
+
+        class_xp = d_class_data.get("experience", 0)
+
+        class_data[d_class]['experience'] = class_xp
+        class_data[d_class]['level'] = get_cata_lvl(class_xp)
+
+    dungeon_data = {
+        "experience": experience,
+        "level": level,
+        "classes": class_data
+    }
+    return dungeon_data
+
+
+def compute_slayer_data(member):
+    slayers = ["zombie", "spider", "wolf", "enderman", "blaze", "vampire"]
+    slayer_data = {slayer: {} for slayer in slayers}
+
+    slayer_api_response = member.get("slayer", {})
+
+    for slayer in slayers:
+        _slayer = slayer_api_response.get(
+            "slayer_bosses", {}).get(slayer, {})
+        experience = _slayer.get("xp", 0)
+        level = get_slayer_level(slayer, experience)
+        slayer_data[slayer]['experience'] = experience
+        slayer_data[slayer]['level'] = level
+
+    slayer_data['raw'] = slayer_api_response.get("slayer_bosses", {})
+
+    return slayer_data
+
+
+def compute_skill_data(member):
+    skills = member.get("player_data", {}).get("experience", {})
+    skill_data = {}
+    for skill in skills:
+        if skill == "SKILL_DUNGEONEERING":
+            continue
+        formatted_skill_string = skill.replace("SKILL_", "").lower()
+        exp = skills[skill]
+        level = get_skill_lvl(formatted_skill_string, exp)
+        skill_data[formatted_skill_string] = {
+            "experience": exp,
+            "level": level
+        }
+
+    return skill_data
+
+
+def compute_mining_data(member):
+    mining_data = member.get("mining_core", {})
+    nodes = mining_data.get("nodes", {})
+    hotm_experience = mining_data.get("experience", 0)
+    hotm_level = get_hotm_level(hotm_experience)
+
+    powder = {
+        "gemstone": {
+            "available": mining_data.get("powder_gemstone", 0),
+            "total": mining_data.get("powder_gemstone", 0) + mining_data.get("powder_spent_gemstone", 0)
+        },
+        "mithril": {
+            "available": mining_data.get("powder_mithril", 0),
+            "total": mining_data.get("powder_mithril_total", 0) + mining_data.get("powder_spent_mithril", 0)
+        },
+        "glacite": {
+            "available": mining_data.get("powder_glacite", 0),
+            "total": mining_data.get("powder_glacite_total", 0) + mining_data.get("powder_spent_glacite", 0)
+        }
+    }
+
+    return {
+        "forge": member.get("forge", {}),
+        "hotm": {
+            "experience": hotm_experience,
+            "level": hotm_level,
+            "tokens": mining_data.get("tokens_spent", 0) + mining_data.get("tokens", 0),
+            "tokens_spent": mining_data.get("tokens_spent", 0),
+            "selected_ability": mining_data.get("selected_pickaxe_ability", ""),
+            "powder": powder,
+            "crystals": mining_data.get("crystals", {}),
+            "nodes": nodes
+        }
+    }
+
+
+def compute_general_stats(member):
+    player_stats = member.get("player_stats", {})
+
+    deaths = player_stats.get("deaths", 0)
+    kills = player_stats.get("kills", 0)
+    auctions = player_stats.get("auctions", {})
+    end_island = player_stats.get("end_island", {})
+    races = player_stats.get("races", {})
+    pets = player_stats.get("pets", {})
+    diana = player_stats.get("mythos", {})
+    rift = player_stats.get("rift", {})
+
+    winter = player_stats.get("winter", {})
+    winter['gifts'] = player_stats.get("gifts", {})
+
+    spooky_festival = player_stats.get("candy_collected", {})
+    spooky = {
+        "total": spooky_festival.get('total', 0),
+        "green_candy": spooky_festival.get("green_candy", 0),
+        "purple_candy": spooky_festival.get("purple_candy", 0),
+        "bats_spawned": player_stats.get("sppoky", {}).get("bats_spawned", {}),
+    }
+
+    damages = {
+        "highest_critical_damage": player_stats.get("highest_critical_damage", 0),
+        "highest_damage": player_stats.get("highest_damage", 0),
+    }
+
+    fishing = {
+        "items_fished": player_stats.get("items_fished", 0),
+        "shredder": player_stats.get("shredder_rod", 0),
+        "sea_creature_kills": player_stats.get("sea_creature_kills", 0),
+        "trophy_fish": member.get("trophy_fish", {})
+    }
+
+    faily_souls = member.get("fairy_soul", {})
+
+    return {
+        "deaths": deaths,
+        "kills": kills,
+        "auctions": auctions,
+        "end_island": end_island,
+        "races": races,
+        "pets": pets,
+        "diana": diana,
+        "rift": rift,
+        "winter": winter,
+        "spooky_festival": spooky,
+        "damages": damages,
+        "fishing": fishing,
+        "fairy_souls": faily_souls
+    }
+
+
+def compute_farming_data(member):
+    jacobs_contests = member.get("jacobs_contest", {})
+    unique_brackets = jacobs_contests.get("unique_brackets", {})
+    perks = jacobs_contests.get("perks", {})
+    medals_inv = jacobs_contests.get("medals_inv", {})
+    contests = jacobs_contests.get("contests", {})
+
+    quests = member.get("quests", {})
+    trapper = quests.get("trapper_quest", {})
+    pelt_count = trapper.get("pelt_count", 0)
+
+
+    farming_data = {
+        "perks": perks,
+        "unique_brackets": unique_brackets,
+        "medals": medals_inv,
+        "contests": contests,
+        "pelts": pelt_count
+    }
+
+    return farming_data
+
+
+# Profile attribute -> function building it from the member data
+STAT_FUNCTIONS = {
+    "dungeon_data": compute_dungeon_data,
+    "slayer_data": compute_slayer_data,
+    "skill_data": compute_skill_data,
+    "mining_data": compute_mining_data,
+    "general_stats": compute_general_stats,
+    "farming_data": compute_farming_data
+}
+
+# member sections the stat functions read, all a worker process gets sent
+STAT_SECTIONS = [
+    "dungeons",
+    "slayer",
+    "player_data",
+    "mining_core",
+    "forge",
+    "player_stats",
+    "trophy_fish",
+    "fairy_soul",
+    "jacobs_contest",
+    "quests"
+]
+
+
+def compute_stats(member, attributes=tuple(STAT_FUNCTIONS)):
+    return {attribute: STAT_FUNCTIONS[attribute](member) for attribute in attributes}
+
+
 class Item:
+    """
+    View over one decoded item compound, fields are read from it when accessed
+    """
+
+    __slots__ = ("data", "_lore")
+
     def __init__(self, data):
+        self.data = data
+        self._lore = None
+
+    @property
+    def attributes(self):
+        return self.data.get("tag", {}).get("ExtraAttributes", {})
+
+    @property
+    def count(self):
+        return self.data.get("Count", 1)
+
+    @property
+    def raw_lore(self):
+        display = self.data.get("tag", {}).get("display", {})
+        return (display.get("Name", ""), *display.get("Lore", []))
+
+    @property
+    def lore(self):
+        if self._lore is None:
+            self._lore = [line.replace("§", "&") for line in self.raw_lore]
+        return self._lore
+
+    @property
+    def lore_runs(self):
+        """
+        LoreRuns per line, from the shared memoized tokenizer
+        """
+        return [tokenize(line) for line in self.raw_lore]
+
+    @property
+    def plain_lore(self):
+        return [plain_text(line) for line in self.lore_runs]
+
+    @property
+    def hot_potato_count(self):
+        return self.attributes.get("hot_potato_count", 0)
+
+    @property
+    def reforge(self):
+        return self.attributes.get("modifier", "")
+
+    @property
+    def stars(self):
+        return self.attributes.get("upgrade_level", 0)
+
+    @property
+    def _id(self):
+        return self.attributes.get("id", "")
+
+    @property
+    def gems(self):
+        return self.attributes.get("gems", {})
+
+    @property
+    def dye(self):
+        return self.attributes.get("dye_item", "")
+
+    @property
+    def enchantments(self):
+        return self.attributes.get("enchantments", {})
+
+    @property
+    def item_uuid(self):
+        return self.attributes.get("uuid", "")
+
+    @property
+    def rarity_upgrades(self):
+        return self.attributes.get("rarity_upgrades", 0)
+
+    @property
+    def soulbound(self):
+        return bool(self.attributes.get("donated_museum")) or any("Soulbound" in line for line in self.raw_lore)
 
-        self.count = data.get("Count", 1)
+    def render(self):
+        # the tokenizer reads § codes as well, no need to build .lore
+        return render(list(self.raw_lore))
 
-        tag = data.get("tag", {})
-        display = tag.get("display", {})
-        item_lore = display.get("Lore", [])
-        item_name = display.get("Name", "")
+    async def render_async(self):
+        return await render_async(self.raw_lore)
 
-        self.lore = []
-        lore = [item_name, *item_lore]
-        for line in lore:
-            line = line.replace("§", "&")
-            self.lore.append(line)
 
-        attributes = tag.get("ExtraAttributes", {})
-        self.hot_potato_count = attributes.get("hot_potato_count", 0)
-        self.reforge = attributes.get("modifier", "")
-        self.stars = attributes.get("upgrade_level", 0)
-        self._id = attributes.get("id", "")
-        self.enchantments = attributes.get("enchantments", {})
-        self.item_uuid = attributes.get("uuid", "")
+def decode_section(nbt):
+    """
+    Returns (items, pets) for one inventory blob, pets stored as items are split out
+    """
+    try:
+        raw = decode_item(nbt)['']['i']
+    except:
+        return [], []
+
+    items = []
+    pets = []
+    for item in raw:
+        if not item:
+            continue
+        if item.get("tag", {}).get("ExtraAttributes", {}).get("id", "") == "PET":
+            pets.append(Pet(item['tag'], False))
+        else:
+            items.append(Item(item))
+
+    return items, pets
+
+
+def decode_inventory(inventory):
+    """
+    Decodes every item section of a member's inventory, returns ({section: items}, pets)
+    """
+    blobs = {}
+    for section in ["inv", "ender_chest", "inv_armor", "wardrobe", "equipment", "personal_vault"]:
+        if section == "inv_armor":
+            blobs[section] = inventory.get(section, {}).get("data", "")
+        else:
+            blobs[section] = inventory.get(section + "_contents", {}).get("data", "")
+
+    for page, data in inventory.get("backpack_contents", {}).items():
+        blobs[f"backpack_{page}"] = data.get("data", "")
+
+    for bag, data in inventory.get("bag_contents", {}).items():
+        blobs[bag] = data.get("data", "")
+
+    sections = {}
+    pets = []
+    for section, nbt in blobs.items():
+        if not nbt:
+            continue
+        sections[section], section_pets = decode_section(nbt)
+        pets.extend(section_pets)
+
+    return sections, pets
+
+
+def decode_museum(museum_data):
+    museum_items = []
+
+    donations = [*museum_data.get("items", {}).values(), *museum_data.get("special", [])]
+    for donation in donations:
+        nbt = donation.get("items", {}).get("data", "")
+        if not nbt:
+            continue
+
+        try:
+            items = decode_item(nbt)['']['i']
+        except:
+            continue
+
+        museum_items.extend(Item(item) for item in items if item)
+
+    return museum_items
 
-    def render(self):
-        return render(self.lore)
 
 class Profile:
-    def __init__(self, profile_data, cute_name, uuid, api_key):
+    def __init__(self, profile_data, cute_name, uuid, api_key, auction_house=None, session:aiohttp.ClientSession=None, hypixel:HypixelClient=None):
         self.profile_data_raw = profile_data
         self.cute_name = cute_name
         self.profile_id = None
@@ -160,7 +558,12 @@ class Profile:
         self.networth_data = None
         self.bank_balance = 0
         self.museum_data = {}
+        self.museum_items = []
+        self.item_sections = []
         self.api_key = api_key
+        self.auction_house = auction_house
+        self.session = session
+        self.hypixel = hypixel or HypixelClient(session, api_key)
 
         for profile in profile_data['profiles']:
 
@@ -213,116 +616,114 @@ class Profile:
         self.currencies = self.profile_data_user.get("currencies", {})
         self.player_data = self.profile_data_user.get("player_data", {})
         self.events = self.profile_data_user.get("events", {})
-        self.get_pets()
-
-    async def get_json(self):
-        await self.get_coop_names()
-        await self.init()
-        await self.get_networth()
-
-        data = {
-            "profile_id": self.profile_id,
-            "uuid": self.uuid,
-            "cute_name": self.cute_name,
-            "profile_type": self.profile_type,
-            "bank_balance": self.bank_balance,
-            "created_at": self.created_at,
-            "skyblock_level": self.skyblock_level,
-            "collections": self.collections,
-            "bestiary": self.bestiary,
-            "nether": self.nether,
-            "currencies": self.currencies,
-            "networth": self.networth_data,
-            "dungeons": self.dungeon_data,
-            "slayers": self.slayer_data,
-            "skills": self.skill_data,
-            "mining": self.mining_data,
-            "general": self.general_stats,
-            "farming": self.farming_data,
-            "coop_names": self.coop_names,
-            "coop_count": len(self.coops),
-            "rift": self.rift,
-            "events": self.events
-        }
 
+    @property
+    def coop_count(self):
+        return len(self.coops)
 
-        return data
+    async def get_json(self, fields=None):
+        """
+        fields selects which JSON_FIELDS keys to build, all of them by default
+        """
+        fields = tuple(JSON_FIELDS) if fields is None else tuple(sorted(fields))
+        check_fields(fields)
+        return await profile_flights.do((self.uuid, self.profile_id, fields), self.build_json, fields)
+
+    async def build_json(self, fields=tuple(JSON_FIELDS)):
+        check_fields(fields)
+
+        if "coop_names" in fields:
+            await self.get_coop_names()
+
+        stats = [JSON_FIELDS[field] for field in fields if JSON_FIELDS[field] in STAT_FUNCTIONS]
+        if stats:
+            await self.load_stats(stats)
+
+        if "networth" in fields:
+            if self.museum_data == {}:
+                await self.get_museum()
+            await self.get_networth()
+
+        return {field: getattr(self, JSON_FIELDS[field]) for field in fields}
 
     async def get_coop_names(self):
         if self.coop_names != []:
             return
         
         names = []
-        async with aiohttp.ClientSession() as session:
-            for member in self.coops:
-                user_data = self._profile['members'].get(member, {})
-                profile = user_data.get("profile", {})
-                deletion_notice = profile.get("deletion_notice", None)
-                wavy = ""
-                if deletion_notice:
-                    wavy = "~~"
-                    
-                async with session.get(f"https://sessionserver.mojang.com/session/minecraft/profile/{member}") as response:
-                    data = await response.json()
-                    username = data.get("name")
-                    if username:
-                        names.append(f"**{wavy}{username}{wavy}**")
-                    else:
-                        names.append("**-**")
+        usernames = await mojang_resolver.get_names(self.coops, self.session)
+        for member in self.coops:
+            user_data = self._profile['members'].get(member, {})
+            profile = user_data.get("profile", {})
+            deletion_notice = profile.get("deletion_notice", None)
+            wavy = ""
+            if deletion_notice:
+                wavy = "~~"
+
+            username = usernames.get(member.replace("-", ""))
+            if username:
+                names.append(f"**{wavy}{username}{wavy}**")
+            else:
+                names.append("**-**")
 
         self.coop_names = names
 
 
-    def get_pets(self):
-        self.pets = []
+    @cached_property
+    def pets(self):
+        pets = []
         pet_data = self.profile_data_user.get("pets_data", {})
         for pet in pet_data.get("pets", []):
             try:
-                self.pets.append(Pet(pet, False))
+                pets.append(Pet(pet, False))
             except SkyblockParserException:
                 continue
 
         if self.profile_data_user.get("rift", {}).get("dead_cats", {}).get("montezuma"):
             try:
-                self.pets.append(
+                pets.append(
                     Pet(self.profile_data_user['rift']['dead_cats']['montezuma'], False))
             except SkyblockParserException:
                 pass
 
+        return pets
+
+    def get_pets(self):
+        return self.pets
+
+    @cached_property
+    def items(self):
+        """
+        Decoded item sections by name, also set as attributes (inv, ender_chest, backpack_0, ...)
+        """
+        return self.apply_items(decode_inventory(self.profile_data_user.get("inventory", {})))
+
     def get_items(self):
+        return self.items
 
-        inventory = self.profile_data_user.get("inventory", {})
-        self.sacks = inventory.get("sacks_counts", {})
-
-        to_decode = [
-            "inv",
-            "ender_chest",
-            "inv_armor",
-            "wardrobe",
-            "equipment",
-            "personal_vault",
-            "backpack"
-        ]
-
-        for item in to_decode:
-            if item == "inv_armor":
-                self.decode_items(inventory.get(item, {}).get("data", ""), item)
-
-            elif item == "backpack":
-                data = inventory.get(item + "_contents", {})
-                for item in data:
-                    page_data = data[item].get("data", "")
-                    self.decode_items(page_data, f"backpack_{item}")
+    async def load_items(self):
+        """
+        Decodes the inventory on cpu_executor, same result as accessing .items
+        """
+        if "items" in self.__dict__:
+            return self.items
 
-            else:
-                self.decode_items(inventory.get(item + "_contents", {}).get("data", ""), item)
+        decoded = await cpu_executor.run(decode_inventory, self.profile_data_user.get("inventory", {}))
+        if "items" not in self.__dict__:
+            self.items = self.apply_items(decoded)
+        return self.items
+
+    def apply_items(self, decoded):
+        sections, pets = decoded
+        self.sacks = self.profile_data_user.get("inventory", {}).get("sacks_counts", {})
+        self.pets.extend(pets)
 
-        self.backpack_count = len([x for x in dir(self) if "backpack_" in x])
+        for section, items in sections.items():
+            setattr(self, section, items)
 
-        bags = inventory.get("bag_contents", {})
-        for bag in bags:	
-            data = bags[bag].get("data", "")
-            self.decode_items(data, bag)
+        self.item_sections = list(sections)
+        self.backpack_count = len([section for section in sections if section.startswith("backpack_")])
+        return sections
 
     async def init(self):
         if self.museum_data != {}:
@@ -333,256 +734,198 @@ class Profile:
 
     async def get_stats(self):
         await asyncio.gather(
-            self.get_dungeon_stats(),
-            self.get_slayer_stats(),
-            self.get_skill_stats(),
-            self.get_mining_stats(),
-            self.get_general_stats(),
-            self.get_networth(),
-            self.get_farming()
+            self.load_stats(),
+            self.get_networth()
         )
 
-    def decode_items(self, nbt, _type):
-        if nbt:
-            try:
-                items = decode_item(nbt)['']['i']
-            except:
-                setattr(self, _type, [])
-                return
+    async def load_stats(self, attributes=tuple(STAT_FUNCTIONS)):
+        """
+        Computes the given stat sections (all by default) on cpu_executor, only the member sections they read get sent along
+        """
+        missing = tuple(attribute for attribute in attributes if attribute not in self.__dict__)
+        if not missing:
+            return
 
-            for index, item in enumerate(items):
-                if item.get("tag", {}).get("ExtraAttributes", {}).get("id", "") == "PET":
-                    self.pets.append(Pet(item['tag'], False))
-                    items.remove(item)
-                    continue
+        member = {section: self.profile_data_user[section] for section in STAT_SECTIONS if section in self.profile_data_user}
+        stats = await cpu_executor.run(compute_stats, member, missing)
 
-            setattr(self, _type, [Item(item) for item in items if item])
-            setattr(self, f"{_type}_raw", items)
+        for attribute, value in stats.items():
+            if attribute not in self.__dict__:
+                setattr(self, attribute, value)
 
     async def get_museum(self):
-        url = f"https://api.hypixel.net/v2/skyblock/museum?key={self.api_key}&profile={self.profile_id}"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                data = await response.json()
-                self.museum_data = data['members'].get(self.uuid, {})
+        data = await self.hypixel.get_museum(self.profile_id)
+        self.museum_data = data['members'].get(self.uuid, {})
+
+
+    def get_museum_items(self):
+        self.museum_items = decode_museum(self.museum_data)
+
+    async def load_museum_items(self):
+        if not self.museum_items:
+            self.museum_items = await cpu_executor.run(decode_museum, self.museum_data)
 
+    def calculate_networth(self):
+        self.items
+
+        if not self.museum_items:
+            self.get_museum_items()
+
+        calculator = NetworthCalculator(self.auction_house.prices, self.auction_house.prices_updated_at, self.auction_house.upgrade_costs)
+        self.networth_data = calculator.calculate(self)
+
+    def networth_payload(self):
+        # only the sections skyhelper-networth reads, the full member can be several MB
+        profile = {
+            section: self.profile_data_user[section]
+            for section in NETWORTH_SECTIONS if section in self.profile_data_user
+        }
+        return {
+            "profile": profile,
+            "bank": self.bank_balance,
+            "museumData": self.museum_data
+        }
 
     async def get_networth(self):
-        if self.networth_data is None:
+        if self.networth_data is not None:
+            return
+
+        price_version = self.auction_house.prices_updated_at if self.auction_house is not None else None
+        key = await networth_cache.key(self)
+
+        self.networth_data = networth_cache.get(key, price_version)
+        if self.networth_data is not None:
+            return
+
+        if self.auction_house is not None:
+            await asyncio.gather(self.load_items(), self.load_museum_items())
+            # a thread even when cpu_executor uses processes, it works on this Profile and item_value_cache
+            await asyncio.get_running_loop().run_in_executor(None, self.calculate_networth)
+
+        else:
             try:
-                url = "http://localhost:5000/networth"
-                body = {
-                    "profile": self.profile_data_user,
-                    "bank": self.bank_balance,
-                    "museumData": self.museum_data
-                }
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(url, json=body) as response:
-                        data = await response.json()
-                        self.networth_data = data
+                self.networth_data = await post_networth(NETWORTH_URL, self.networth_payload(), self.session)
             except Exception as e:
                 print(f"Warning: Could not fetch networth data from local server: {e}")
                 print("Setting networth to 0. You can start the networth server separately if needed.")
                 self.networth_data = {"networth": 0}
+                return
 
-    async def get_dungeon_stats(self):
-        experience = self.profile_data_user.get("dungeons", {}).get(
-            "dungeon_types", {}).get("catacombs", {}).get("experience", 0)
-        level = get_cata_lvl(experience)
-
-        classes = [
-            "healer",
-            "mage",
-            "berserk",
-            "archer",
-            "tank"
-        ]
-
-        class_data = {_class: {} for _class in classes}
+        networth_cache.set(key, self.networth_data, price_version)
 
-        for d_class in classes:
-            d_class_data = self.profile_data_user.get("dungeons", {}).get(
-                "player_classes", {}).get(d_class, {})
+    @staticmethod
+    async def get_networth_batch(profiles, chunk_size=25, session=None):
+        """
+        Networth for many profiles through /networth/batch, chunks are sent concurrently so a clustered sidecar can spread them
+        """
+        pending = []
+        for profile in profiles:
+            if profile.networth_data is not None:
+                continue
 
-            class_xp = d_class_data.get("experience", 0)
+            if profile.auction_house is not None:
+                await profile.get_networth()
+                continue
 
-            class_data[d_class]['experience'] = class_xp
-            class_data[d_class]['level'] = get_cata_lvl(class_xp)
+            key = await networth_cache.key(profile)
+            profile.networth_data = networth_cache.get(key)
+            if profile.networth_data is None:
+                pending.append((profile, key))
 
-        dungeon_data = {
-            "experience": experience,
-            "level": level,
-            "classes": class_data
-        }
-        self.dungeon_data = dungeon_data
-        return
+        async def run(chunk):
+            body = {
+                "profiles": [{"id": index, **profile.networth_payload()} for index, (profile, _) in enumerate(chunk)]
+            }
+            try:
+                results = {result['id']: result for result in await post_networth(NETWORTH_BATCH_URL, body, session)}
+            except Exception as e:
+                print(f"Warning: Could not fetch batch networth data from local server: {e}")
+                results = {}
 
-    async def get_slayer_stats(self):
-        slayers = ["zombie", "spider", "wolf", "enderman", "blaze", "vampire"]
-        slayer_data = {slayer: {} for slayer in slayers}
+            for index, (profile, key) in enumerate(chunk):
+                result = results.get(index, {})
+                if "networth" in result:
+                    profile.networth_data = result['networth']
+                    networth_cache.set(key, profile.networth_data)
+                else:
+                    profile.networth_data = {"networth": 0}
 
-        slayer_api_response = self.profile_data_user.get("slayer", {})
+        await asyncio.gather(*[run(pending[i:i + chunk_size]) for i in range(0, len(pending), chunk_size)])
 
-        for slayer in slayers:
-            _slayer = slayer_api_response.get(
-                "slayer_bosses", {}).get(slayer, {})
-            experience = _slayer.get("xp", 0)
-            level = get_slayer_level(slayer, experience)
-            slayer_data[slayer]['experience'] = experience
-            slayer_data[slayer]['level'] = level
+        return [profile.networth_data for profile in profiles]
 
-        slayer_data['raw'] = slayer_api_response.get("slayer_bosses", {})
+    async def get_dungeon_stats(self):
+        await self.load_stats(["dungeon_data"])
+        return self.dungeon_data
 
-        self.slayer_data = slayer_data
-        return
+    async def get_slayer_stats(self):
+        await self.load_stats(["slayer_data"])
+        return self.slayer_data
 
     async def get_skill_stats(self):
-        skills = self.profile_data_user.get("player_data", {}).get("experience", {})
-        skill_data = {}
-        for skill in skills:
-            if skill == "SKILL_DUNGEONEERING":
-                continue
-            formatted_skill_string = skill.replace("SKILL_", "").lower()
-            exp = skills[skill]
-            level = get_skill_lvl(formatted_skill_string, exp)
-            skill_data[formatted_skill_string] = {
-                "experience": exp,
-                "level": level
-            }
+        await self.load_stats(["skill_data"])
+        return self.skill_data
 
-        self.skill_data = skill_data
-        return 
-    
     async def get_mining_stats(self):
-        mining_data = self.profile_data_user.get("mining_core", {})
-        nodes = mining_data.get("nodes", {})
-        hotm_experience = mining_data.get("experience", 0)
-        hotm_level = get_hotm_level(hotm_experience)
-
-        powder = {
-            "gemstone": {
-                "available": mining_data.get("powder_gemstone", 0),
-                "total": mining_data.get("powder_gemstone", 0) + mining_data.get("powder_spent_gemstone", 0)
-            },
-            "mithril": {
-                "available": mining_data.get("powder_mithril", 0),
-                "total": mining_data.get("powder_mithril_total", 0) + mining_data.get("powder_spent_mithril", 0)
-            },
-            "glacite": {
-                "available": mining_data.get("powder_glacite", 0),
-                "total": mining_data.get("powder_glacite_total", 0) + mining_data.get("powder_spent_glacite", 0)
-            }
-        }
-
-        self.mining_data = {
-            "forge": self.profile_data_user.get("forge", {}),
-            "hotm": {
-                "experience": hotm_experience,
-                "level": hotm_level,
-                "tokens": mining_data.get("tokens_spent", 0) + mining_data.get("tokens", 0),
-                "tokens_spent": mining_data.get("tokens_spent", 0),
-                "selected_ability": mining_data.get("selected_pickaxe_ability", ""),
-                "powder": powder,
-                "crystals": mining_data.get("crystals", {}),
-                "nodes": nodes
-            }
-        }
+        await self.load_stats(["mining_data"])
+        return self.mining_data
 
-        return
-    
     async def get_general_stats(self):
-        player_stats = self.profile_data_user.get("player_stats", {})
-
-        deaths = player_stats.get("deaths", 0)
-        kills = player_stats.get("kills", 0)
-        auctions = player_stats.get("auctions", {})
-        end_island = player_stats.get("end_island", {})
-        races = player_stats.get("races", {})
-        pets = player_stats.get("pets", {})
-        diana = player_stats.get("mythos", {})
-        rift = player_stats.get("rift", {})
-
-        winter = player_stats.get("winter", {})
-        winter['gifts'] = player_stats.get("gifts", {})
-
-        spooky_festival = player_stats.get("candy_collected", {})
-        spooky = {
-            "total": spooky_festival.get('total', 0),
-            "green_candy": spooky_festival.get("green_candy", 0),
-            "purple_candy": spooky_festival.get("purple_candy", 0),
-            "bats_spawned": player_stats.get("sppoky", {}).get("bats_spawned", {}),
-        }
+        await self.load_stats(["general_stats"])
+        return self.general_stats
 
-        damages = {
-            "highest_critical_damage": player_stats.get("highest_critical_damage", 0),
-            "highest_damage": player_stats.get("highest_damage", 0),
-        }
+    async def get_farming(self):
+        await self.load_stats(["farming_data"])
+        return self.farming_data
 
-        fishing = {
-            "items_fished": player_stats.get("items_fished", 0),
-            "shredder": player_stats.get("shredder_rod", 0),
-            "sea_creature_kills": player_stats.get("sea_creature_kills", 0),
-            "trophy_fish": self.profile_data_user.get("trophy_fish", {})
-        }
+    @cached_property
+    def dungeon_data(self):
+        return compute_dungeon_data(self.profile_data_user)
 
-        faily_souls = self.profile_data_user.get("fairy_soul", {})
-
-        self.general_stats = {
-            "deaths": deaths,
-            "kills": kills,
-            "auctions": auctions,
-            "end_island": end_island,
-            "races": races,
-            "pets": pets,
-            "diana": diana,
-            "rift": rift,
-            "winter": winter,
-            "spooky_festival": spooky,
-            "damages": damages,
-            "fishing": fishing,
-            "fairy_souls": faily_souls
-        }
+    @cached_property
+    def slayer_data(self):
+        return compute_slayer_data(self.profile_data_user)
 
-        return
-    
-    async def get_farming(self):
-        jacobs_contests = self.profile_data_user.get("jacobs_contest", {})
-        unique_brackets = jacobs_contests.get("unique_brackets", {})
-        perks = jacobs_contests.get("perks", {})
-        medals_inv = jacobs_contests.get("medals_inv", {})
-        contests = jacobs_contests.get("contests", {})
-
-        quests = self.profile_data_user.get("quests", {})
-        trapper = quests.get("trapper_quest", {})
-        pelt_count = trapper.get("pelt_count", 0)
-
-
-        farming_data = {
-            "perks": perks,
-            "unique_brackets": unique_brackets,
-            "medals": medals_inv,
-            "contests": contests,
-            "pelts": pelt_count
-        }
+    @cached_property
+    def skill_data(self):
+        return compute_skill_data(self.profile_data_user)
 
-        self.farming_data = farming_data
+    @cached_property
+    def mining_data(self):
+        return compute_mining_data(self.profile_data_user)
+
+    @cached_property
+    def general_stats(self):
+        return compute_general_stats(self.profile_data_user)
+
+    @cached_property
+    def farming_data(self):
+        return compute_farming_data(self.profile_data_user)
 
 class SkyblockParser:
     """
     Use raw Hypixel API Data
     """
 
-    def __init__(self, data, uuid, api_key):
+    def __init__(self, data, uuid, api_key, auction_house=None, session:aiohttp.ClientSession=None, hypixel:HypixelClient=None):
         self.profiles = data
         self.uuid = uuid
         self.api_key = api_key
+        self.auction_house = auction_house
+        self.session = session
+        self.hypixel = hypixel
 
         if data.get("success") is False:
             reason = data.get("cause")
             raise SkyblockParserException(reason)
 
+    @classmethod
+    async def fetch(cls, hypixel:HypixelClient, uuid, auction_house=None, force=False):
+        data = await hypixel.get_profiles(uuid, force=force)
+        return cls(data, uuid, hypixel.api_key, auction_house, hypixel.session, hypixel)
+
     def select_profile(self, cute_name):
-        return Profile(self.profiles, cute_name, self.uuid, self.api_key)
+        return Profile(self.profiles, cute_name, self.uuid, self.api_key, self.auction_house, self.session, self.hypixel)
     
     def get_profiles(self):
         return [x['cute_name'] for x in self.profiles['profiles']]
\ No newline at end of file
@@ -2,393 +2,193 @@ from PIL import Image, ImageDraw, ImageFont
 import os
 import string
 
-text_colors = {"0": ["black", (0, 0, 0)], "1": ["dark blue", (0, 0, 170)], "2": ["dark green", (0, 170, 0)], "3": ["dark aqua", (0, 170, 170)], "4": ["dark red", (170, 0, 0)], "5": ["dark purple", (170, 0, 170)], "6": ["gold", (255, 170, 0)], "7": ["gray", (170, 170, 170)], "8": [
-                               "dark_gray", (85, 85, 85)], "9": ["blue", (85, 85, 255)], "a": ["green", (85, 255, 85)], "b": ["aqua", (85, 255, 255)], "c": ["red", (255, 85, 85)], "d": ["light purple", (255, 85, 255)], "e": ["yellow", (255, 255, 85)], "f": ["white", (255, 255, 255)]}
-shadow_colors = {"0": ["black", (0, 0, 0)], "1": ["dark blue", (0, 0, 42)], "2": ["dark green", (0, 42, 0)], "3": ["dark aqua", (0, 42, 42)], "4": ["dark red", (42, 0, 0)], "5": ["dark purple", (42, 0, 42)], "6": ["gold", (42, 42, 0)], "7": ["gray", (42, 42, 42)], "8": [
-                                 "dark_gray", (21, 21, 21)], "9": ["blue", (21, 21, 63)], "a": ["green", (21, 63, 21)], "b": ["aqua", (21, 63, 63)], "c": ["red", (63, 21, 21)], "d": ["light purple", (63, 21, 63)], "e": ["yellow", (63, 63, 21)], "f": ["white", (63, 63, 63)]}
+from skyblock_parser.executor import cpu_executor
+from skyblock_parser.lore import text_colors, shadow_colors, tokenize
+
 dir_path = os.path.dirname(os.path.realpath(__file__))
 letters = string.ascii_letters
 
 
-def draw_italics(char, x, y, width, height, background, fnt, color):
+# font class (see LoreRun.font) -> file in ./fonts and size
+FONTS = {
+    "regular": ("MinecraftRegular.otf", 20),
+    "bold": ("MinecraftBold.otf", 20),
+    "italic": ("MinecraftItalic.otf", 20),
+    "bold_italic": ("MinecraftBoldItalic.otf", 20),
+    "unicode": ("unifont.ttf", 16),
+}
+
+
+class FontRegistry:
     """
-    Creates a new image and imprints the character on the new image and modifies it
-    Image is then copied onto the original image
+    Loads each font once and remembers every glyph's bbox, so measuring a line is only table lookups
     """
-    foreground = Image.new("RGBA", (width, height))
-    foreground_draw = ImageDraw.Draw(foreground)
 
-    size = fnt.bbox(char)[0]
-    foreground_draw.text((x, y), char, font=fnt, fill=color)
+    def __init__(self, fonts=FONTS, preload=letters + string.digits + string.punctuation):
+        self.fonts = fonts
+        self.preload = preload
+        self.faces = {}
+        self.metrics = {}
 
-    region = foreground.crop((x, y+2, size+x, y+4))
-    foreground_draw.rectangle((x, y+2, size+x, y+3),
-                              outline=(0, 0, 0), fill=(0, 0, 0))
-    foreground.paste(region, (x+2, y+2))
+    def font(self, font_class):
+        face = self.faces.get(font_class)
+        if face is None:
+            file_name, size = self.fonts[font_class]
+            try:
+                face = ImageFont.truetype(os.path.join(dir_path, "fonts", file_name), size)
+            except OSError:
+                if font_class == "regular":
+                    raise
+                print(f"Warning: Could not load fonts/{file_name}, drawing {font_class} text with the regular font")
+                face = self.font("regular")
 
-    region = foreground.crop((x, y+4, size+x, y+6))
-    foreground_draw.rectangle((x, y+4, size+x, y+5),
-                              outline=(0, 0, 0), fill=(0, 0, 0))
-    foreground.paste(region, (x+1, y+4))
+            self.metrics[font_class] = {char: face.getbbox(char) for char in self.preload}
+            self.faces[font_class] = face
+        return face
 
-    region = foreground.crop((x, y+6, size+x, y+8))
-    foreground_draw.rectangle((x, y+6, size+x, y+7),
-                              outline=(0, 0, 0), fill=(0, 0, 0))
-    foreground.paste(region, (x+1, y+6))
+    def bbox(self, font_class, char):
+        metrics = self.metrics.get(font_class)
+        if metrics is None:
+            self.font(font_class)
+            metrics = self.metrics[font_class]
 
+        box = metrics.get(char)
+        if box is None:
+            box = metrics[char] = self.faces[font_class].getbbox(char)
+        return box
 
-    region = foreground.crop((x, y+12, size+x, y+16))
-    foreground_draw.rectangle((x, y+12, size+x, y+15),
-                              outline=(0, 0, 0), fill=(0, 0, 0))
-    foreground.paste(region, (x-1, y+12))
 
-    region = foreground.crop((x, y+16, size+x, y+19))
-    foreground_draw.rectangle((x, y+16, size+x, y+18),
-                              outline=(0, 0, 0), fill=(0, 0, 0))
-    foreground.paste(region, (x-2, y+16))
+font_registry = FontRegistry()
 
-    background.paste(foreground, (0, 0), foreground)
-    return background
 
-def render(lore_lines):
-    lore_lines.insert(1, [])
-    processed_lines = []
-
-    for line in lore_lines:
-        special_character = False
-        code_character = False
-        bolded = False
-        italics = False
-        shadow_color = (63, 63, 63)
-        color = (255, 255, 255)
-        if line == "":
-            processed_lines.append([])
-        else:
-            lore_location = len(processed_lines)
-            processed_lines.append([])
-
-            for char in line:
-                if ord(char) > 127:
-                    special_character = True
-                if char == "️":
-                    special_character = False
-                elif char == "&":
-                    code_character = True
-                elif code_character is True:
-                    code_character = False
-                    if char in text_colors:
-                        color = text_colors[char][1]
-                        shadow_color = shadow_colors[char][1]
-                    elif char == "r":
-                        color = (255, 255, 255)
-                        italics = False
-                        bolded = False
-                    elif char == "l":
-                        bolded = True
-                    elif char == "o":
-                        italics = True
-                else:
-                    processed_lines[lore_location].append(
-                        [char, color, bolded, italics, special_character, shadow_color])
-                    special_character = False
+class GlyphAtlas:
+    """
+    Every (font class, character) rasterized once into an "L" mask,
+    drawing a glyph is pasting its mask with the fill color, the shadow pass reuses the same masks
+    """
+
+    def __init__(self, registry=font_registry):
+        self.registry = registry
+        self.glyphs = {}
+
+    def glyph(self, font_class, char):
+        glyph = self.glyphs.get((font_class, char))
+        if glyph is None:
+            left, top, right, bottom = self.registry.bbox(font_class, char)
+            if right > left and bottom > top:
+                mask = Image.new("L", (right - left, bottom - top))
+                ImageDraw.Draw(mask).text((-left, -top), char, font=self.registry.font(font_class), fill=255)
+            else:
+                mask = None
+            glyph = self.glyphs[(font_class, char)] = (mask, left, top)
+        return glyph
+
+    def draw(self, img, x, y, font_class, char, color):
+        mask, left, top = self.glyph(font_class, char)
+        if mask is not None:
+            img.paste(color, (x + left, y + top), mask)
+
+
+glyph_atlas = GlyphAtlas()
 
+
+def measure_width(processed_lines, advance=2):
     width = 0
-    height = 18 + 24 + 20 + 14 + ((len(processed_lines)-4)*20)
     x = 8
     for line in processed_lines:
-        if line == []:
-            pass
-        else:
-            for char in line:
-                if char[2] is True:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/MinecraftBold.otf", 20)
-                else:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/MinecraftRegular.otf", 20)
-                if char[4] is True:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/unifont.ttf", 16)
-                if char[0] == " ":
-                    size = 10
-                    x = size + x
+        if not line:
+            continue
+
+        for run in line:
+            for char in run.text:
+                if char == " ":
+                    x = 10 + x
                 else:
-                    size = fnt.getbbox(char[0])[2]
-                    x = size + x
-            if x > width:
-                width = x + 10
-            x = 8
+                    x = font_registry.bbox(run.font, char)[advance] + x
+        if x > width:
+            width = x + 10
+        x = 8
 
+    return width
 
-    img = Image.new("RGB", (width, height), color=(0, 0, 0))
-    draw = ImageDraw.Draw(img)
 
+def draw_runs(img, processed_lines, shadow, advance=2):
+    """
+    Draws every line once, shadow=True for the offset pass underneath
+    """
     x = 8
     line_number = 0
     for line in processed_lines:
         line_number = line_number + 1
-        if not line == []:
-            for char in line:
-                if char[2] is True:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/MinecraftBold.otf", 20)
-                else:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/MinecraftRegular.otf", 20)
-                color = char[5]
-                if char[4] is True:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/unifont.ttf", 16)
-                    if line_number == 1:
-                        draw.text((x, 8), char[0], font=fnt, fill=color)
-                    else:
-                        draw.text(
-                            (x, 25+((line_number-2)*7+(13*(line_number-3)))), char[0], font=fnt, fill=color)
-                else:
-                    if char[3] is True:
-                        if line_number == 1:
-                            img = draw_italics(
-                                char[0], x+2, 8, width, height, img, fnt, color)
-                        else:
-                            img = draw_italics(
-                                char[0], x+2, 25+((line_number-2)*7+(13*(line_number-3))), width, height, img, fnt, color)
+        if not line:
+            continue
 
-                    else:
-                        if line_number == 1:
-                            draw.text((x+2, 8), char[0], font=fnt, fill=color)
-                        else:
-                            draw.text(
-                                (x+2, 25+((line_number-2)*7+(13*(line_number-3)))), char[0], font=fnt, fill=color)
-
-                if char[0] == " ":
-                    if char[2] is True:
-                        size = 10
-                    else:
-                        size = 8
-                    x = size + x
-                else:
-                    size = fnt.getbbox(char[0])[2]
-                    x = size + x
-            x = 8
+        if line_number == 1:
+            special_y = 8
+            text_y = 8 if shadow else 6
+        else:
+            special_y = 25+((line_number-2)*7+(13*(line_number-3)))
+            text_y = special_y if shadow else special_y - 2
+        text_x = 2 if shadow else 0
 
-    x = 8
-    line_number = 0
-    for line in processed_lines:
-        line_number = line_number + 1
-        if not line == []:
-            for char in line:
-                if char[2] is True:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/MinecraftBold.otf", 20)
-                else:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/MinecraftRegular.otf", 20)
-                color = char[1]
-                if char[4] is True:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/unifont.ttf", 16)
-                    if line_number == 1:
-                        draw.text((x, 8), char[0], font=fnt, fill=color)
-                    else:
-                        draw.text(
-                            (x, 25+((line_number-2)*7+(13*(line_number-3)))), char[0], font=fnt, fill=color)
-                else:
-                    if char[3] is True:
-                        if line_number == 1:
-                            img = draw_italics(
-                                char[0], x, 6, width, height, img, fnt, color)
-                        else:
-                            img = draw_italics(
-                                char[0], x, 23+((line_number-2)*7+(13*(line_number-3))), width, height, img, fnt, color)
+        for run in line:
+            font_class = run.font
+            color = run.shadow_color if shadow else run.color
 
-                    else:
-                        if line_number == 1:
-                            draw.text((x, 6), char[0], font=fnt, fill=color)
-                        else:
-                            draw.text(
-                                (x, 23+((line_number-2)*7+(13*(line_number-3)))), char[0], font=fnt, fill=color)
-
-                if char[0] == " ":
-                    if char[2] is True:
+            for char in run.text:
+                if char == " ":
+                    if run.bold:
                         size = 10
                     else:
                         size = 8
                     x = size + x
+                    continue
+
+                if run.special:
+                    glyph_atlas.draw(img, x, special_y, font_class, char, color)
                 else:
-                    size = fnt.getbbox(char[0])[2]
-                    x = size + x
-            x = 8
+                    glyph_atlas.draw(img, x+text_x, text_y, font_class, char, color)
+
+                size = font_registry.bbox(font_class, char)[advance]
+                x = size + x
+        x = 8
 
     return img
 
 
-def render_bridge(message):
-    lore_lines = [message, ""]
-    processed_lines = []
-
-    for line in lore_lines:
-        special_character = False
-        code_character = False
-        bolded = False
-        italics = False
-        shadow_color = (63, 63, 63)
-        color = (255, 255, 255)
-        if line == "":
-            processed_lines.append([])
-        else:
-            lore_location = len(processed_lines)
-            processed_lines.append([])
-
-            for char in line:
-                if ord(char) > 127:
-                    special_character = True
-                if char == "️":
-                    special_character = False
-                elif char == "&":
-                    code_character = True
-                elif code_character is True:
-                    code_character = False
-                    if char in text_colors:
-                        color = text_colors[char][1]
-                        shadow_color = shadow_colors[char][1]
-                    elif char == "r":
-                        color = (255, 255, 255)
-                        italics = False
-                        bolded = False
-                    elif char == "l":
-                        bolded = True
-                    elif char == "o":
-                        italics = True
-                else:
-                    processed_lines[lore_location].append(
-                        [char, color, bolded, italics, special_character, shadow_color])
-                    special_character = False
+def render(lore_lines):
+    lore_lines.insert(1, "")
+    # lines can be formatted strings or already tokenized LoreRuns
+    processed_lines = [line if isinstance(line, tuple) else tokenize(line) if line else () for line in lore_lines]
 
-    width = 0
+    width = measure_width(processed_lines)
     height = 18 + 24 + 20 + 14 + ((len(processed_lines)-4)*20)
-    x = 8
-    for line in processed_lines:
-        if line == []:
-            pass
-        else:
-            for char in line:
-                if char[2] is True:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/MinecraftBold.otf", 20)
-                else:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/MinecraftRegular.otf", 20)
-                if char[4] is True:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/unifont.ttf", 16)
-                if char[0] == " ":
-                    size = 10
-                    x = size + x
-                else:
-                    size = fnt.getbbox(char[0])[0]
-                    x = size + x
-            if x > width:
-                width = x + 10
-            x = 8
 
+    img = Image.new("RGB", (width, height), color=(0, 0, 0))
 
-    img = Image.new("RGBA", (width, height))
-    draw = ImageDraw.Draw(img)
+    img = draw_runs(img, processed_lines, shadow=True)
+    img = draw_runs(img, processed_lines, shadow=False)
 
-    x = 8
-    line_number = 0
-    for line in processed_lines:
-        line_number = line_number + 1
-        if not line == []:
-            for char in line:
-                if char[2] is True:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/MinecraftBold.otf", 20)
-                else:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/MinecraftRegular.otf", 20)
-                color = char[5]
-                if char[4] is True:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/unifont.ttf", 16)
-                    if line_number == 1:
-                        draw.text((x, 8), char[0], font=fnt, fill=color)
-                    else:
-                        draw.text(
-                            (x, 25+((line_number-2)*7+(13*(line_number-3)))), char[0], font=fnt, fill=color)
-                else:
-                    if char[3] is True:
-                        if line_number == 1:
-                            img = draw_italics(
-                                char[0], x+2, 8, width, height, img, fnt, color)
-                        else:
-                            img = draw_italics(
-                                char[0], x+2, 25+((line_number-2)*7+(13*(line_number-3))), width, height, img, fnt, color)
+    return img
 
-                    else:
-                        if line_number == 1:
-                            draw.text((x+2, 8), char[0], font=fnt, fill=color)
-                        else:
-                            draw.text(
-                                (x+2, 25+((line_number-2)*7+(13*(line_number-3)))), char[0], font=fnt, fill=color)
-
-                if char[0] == " ":
-                    if char[2] is True:
-                        size = 10
-                    else:
-                        size = 8
-                    x = size + x
-                else:
-                    size = fnt.getbbox(char[0])[0]
-                    x = size + x
-            x = 8
 
-    x = 8
-    line_number = 0
-    for line in processed_lines:
-        line_number = line_number + 1
-        if not line == []:
-            for char in line:
-                if char[2] is True:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/MinecraftBold.otf", 20)
-                else:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/MinecraftRegular.otf", 20)
-                color = char[1]
-                if char[4] is True:
-                    fnt = ImageFont.truetype(
-                        dir_path + "/fonts/unifont.ttf", 16)
-                    if line_number == 1:
-                        draw.text((x, 8), char[0], font=fnt, fill=color)
-                    else:
-                        draw.text(
-                            (x, 25+((line_number-2)*7+(13*(line_number-3)))), char[0], font=fnt, fill=color)
-                else:
-                    if char[3] is True:
-                        if line_number == 1:
-                            img = draw_italics(
-                                char[0], x, 6, width, height, img, fnt, color)
-                        else:
-                            img = draw_italics(
-                                char[0], x, 23+((line_number-2)*7+(13*(line_number-3))), width, height, img, fnt, color)
+async def render_async(lore_lines):
+    """
+    render() on cpu_executor, lore_lines is copied so the caller's list is left alone
+    """
+    return await cpu_executor.run(render, list(lore_lines))
 
-                    else:
-                        if line_number == 1:
-                            draw.text((x, 6), char[0], font=fnt, fill=color)
-                        else:
-                            draw.text(
-                                (x, 23+((line_number-2)*7+(13*(line_number-3)))), char[0], font=fnt, fill=color)
-
-                if char[0] == " ":
-                    if char[2] is True:
-                        size = 10
-                    else:
-                        size = 8
-                    x = size + x
-                else:
-                    size = fnt.getbbox(char[0])[2]
-                    x = size + x
-            x = 8
+
+def render_bridge(message):
+    processed_lines = [tokenize(message) if message else (), ()]
+
+    # the bridge has always advanced by the glyph's left edge in the width and shadow passes
+    width = measure_width(processed_lines, advance=0)
+    height = 18 + 24 + 20 + 14 + ((len(processed_lines)-4)*20)
+
+    img = Image.new("RGBA", (width, height))
+
+    img = draw_runs(img, processed_lines, shadow=True, advance=0)
+    img = draw_runs(img, processed_lines, shadow=False)
 
     return img
@@ -0,0 +1,94 @@
+import time
+from array import array
+from collections import deque
+
+
+SALE_WINDOWS = {
+    "1h": 60 * 60,
+    "24h": 24 * 60 * 60,
+    "7d": 7 * 24 * 60 * 60,
+}
+
+
+class RingBuffer:
+    """
+    Fixed size buffer of (timestamp, price) pairs, oldest entries get overwritten
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.timestamps = array("d", bytes(8 * capacity))
+        self.prices = array("d", bytes(8 * capacity))
+        self.head = 0
+        self.size = 0
+
+    def append(self, timestamp, price):
+        self.timestamps[self.head] = timestamp
+        self.prices[self.head] = price
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def oldest(self):
+        if self.size == 0:
+            return None
+        return self.timestamps[self.head if self.size == self.capacity else 0]
+
+    def since(self, timestamp):
+        return [
+            self.prices[i] for i in range(self.size)
+            if self.timestamps[i] >= timestamp
+        ]
+
+
+class SalesTracker:
+    def __init__(self, capacity=512, windows=SALE_WINDOWS, seen_limit=20000):
+        self.capacity = capacity
+        self.windows = windows
+        self.buffers = {}
+
+        self._seen = set()
+        self._seen_order = deque()
+        self._seen_limit = seen_limit
+
+    def add(self, auction_id, item_id, price, timestamp):
+        # the ended feed overlaps between polls, only count each auction once
+        if auction_id in self._seen:
+            return False
+
+        self._seen.add(auction_id)
+        self._seen_order.append(auction_id)
+        if len(self._seen_order) > self._seen_limit:
+            self._seen.discard(self._seen_order.popleft())
+
+        buffer = self.buffers.get(item_id)
+        if buffer is None:
+            buffer = self.buffers[item_id] = RingBuffer(self.capacity)
+        buffer.append(timestamp, price)
+        return True
+
+    def stats(self, item_id, now=None):
+        if now is None:
+            now = time.time()
+
+        buffer = self.buffers.get(item_id)
+        data = {}
+        for name, length in self.windows.items():
+            prices = sorted(buffer.since(now - length)) if buffer else []
+            data[name] = {
+                "count": len(prices),
+                "median": median(prices),
+                "volume": sum(prices),
+                # older sales of this window were overwritten, count and volume are lower bounds
+                "truncated": buffer is not None and buffer.size == buffer.capacity and buffer.oldest() >= now - length,
+            }
+        return data
+
+
+def median(values):
+    if not values:
+        return None
+
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2
@@ -0,0 +1,22 @@
+import aiohttp
+
+_default_session = None
+
+
+def default_session():
+    """
+    Keep-alive session shared by everything in the parser that wasn't handed one
+    """
+    global _default_session
+    if _default_session is None or _default_session.closed:
+        _default_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60),
+            # like utils/http.py, no total timeout so time queued behind the pool limit doesn't count
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=30)
+        )
+    return _default_session
+
+
+async def close_default_session():
+    if _default_session is not None and not _default_session.closed:
+        await _default_session.close()
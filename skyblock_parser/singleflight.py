@@ -0,0 +1,21 @@
+import asyncio
+
+
+class SingleFlight:
+    """
+    Concurrent calls with the same key share one in-progress task and get the same result
+    """
+
+    def __init__(self):
+        self.calls = {}
+
+    async def do(self, key, func, *args, **kwargs):
+        task = self.calls.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self.calls[key] = task
+            task.add_done_callback(lambda _: self.calls.pop(key, None))
+
+        # one caller giving up shouldn't cancel the call for everyone else
+        return await asyncio.shield(task)
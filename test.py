@@ -1,20 +1,24 @@
 from skyblock_parser.profile import SkyblockParser
-import requests
 import asyncio
 from config import HYPIXEL_API_KEY
 from utils.uuid import getuid
+from utils.http import http_client
+from skyblock_parser.hypixel import HypixelClient
 
 async def test():
-    username = "Refraction"
-    uuid = await getuid(username)
+    session = http_client.get_session()
 
-    url = f"https://api.hypixel.net/v2/skyblock/profiles?key={HYPIXEL_API_KEY}&uuid={uuid}"
-    response = requests.get(url).json()
+    username = "Refraction"
+    uuid = await getuid(username, session)
 
-    player = SkyblockParser(response, uuid, HYPIXEL_API_KEY)
+    hypixel = HypixelClient(session, HYPIXEL_API_KEY)
+    player = await SkyblockParser.fetch(hypixel, uuid)
     print(player.get_profiles())
     profile = player.select_profile("selected")
     await profile.init()
 
+    print(http_client.latency_stats())
+    await http_client.close()
+
 if __name__ == "__main__":
     asyncio.run(test())
\ No newline at end of file
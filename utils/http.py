@@ -0,0 +1,75 @@
+import time
+import aiohttp
+
+
+class HttpClient:
+    """
+    One pooled aiohttp session for the whole bot, hand get_session() to the parsers and utils
+    """
+
+    def __init__(self, limit=100, limit_per_host=10, dns_ttl=300, keepalive=30, connect_timeout=10, read_timeout=15):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive = keepalive
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+        self.session = None
+        self.stats = {}
+
+    def get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            trace = aiohttp.TraceConfig()
+            trace.on_request_start.append(self._on_request_start)
+            trace.on_request_end.append(self._on_request_end)
+            trace.on_request_exception.append(self._on_request_exception)
+
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=self.dns_ttl,
+                    keepalive_timeout=self.keepalive
+                ),
+                # no total timeout, it would also count the time spent queued behind limit_per_host,
+                # a full auction house scan queues ~100 pages on api.hypixel.net
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.connect_timeout, sock_read=self.read_timeout),
+                trace_configs=[trace]
+            )
+        return self.session
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    def record(self, host, elapsed, error=False):
+        stats = self.stats.setdefault(host, {"requests": 0, "errors": 0, "total_time": 0.0, "max_time": 0.0})
+        stats["requests"] += 1
+        stats["total_time"] += elapsed
+        stats["max_time"] = max(stats["max_time"], elapsed)
+        if error:
+            stats["errors"] += 1
+
+    def latency_stats(self):
+        return {
+            host: {
+                "requests": stats["requests"],
+                "errors": stats["errors"],
+                "avg_ms": stats["total_time"] / stats["requests"] * 1000,
+                "max_ms": stats["max_time"] * 1000
+            }
+            for host, stats in self.stats.items()
+        }
+
+    async def _on_request_start(self, session, context, params):
+        context.start = time.perf_counter()
+
+    async def _on_request_end(self, session, context, params):
+        self.record(params.url.host, time.perf_counter() - context.start, params.response.status >= 400)
+
+    async def _on_request_exception(self, session, context, params):
+        self.record(params.url.host, time.perf_counter() - context.start, True)
+
+
+http_client = HttpClient()
@@ -0,0 +1,147 @@
+import os
+import sys
+import time
+import asyncio
+import threading
+import traceback
+from collections import deque
+
+root_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# code under these folders gets blamed for a blocked loop
+ATTRIBUTED_FOLDERS = ("commands", "skyblock_parser", "utils")
+
+
+class LoopMonitor:
+    """
+    Measures event loop lag with a heartbeat task, a watchdog thread samples the loop's stack
+    when the heartbeat is late by more than threshold seconds
+    """
+
+    def __init__(self, interval=0.25, threshold=0.2, history=240, max_blocks=50):
+        self.interval = interval
+        self.threshold = threshold
+
+        self.lags = deque(maxlen=history)
+        self.blocks = deque(maxlen=max_blocks)
+
+        self.enabled = False
+        self.loop = None
+        self.loop_thread = None
+        self.task = None
+        self.thread = None
+        self.beat = 0.0
+        self.sampled_beat = None
+
+    def start(self, loop=None):
+        """
+        Has to be called from the loop's thread
+        """
+        if self.enabled:
+            return
+
+        self.loop = loop or asyncio.get_running_loop()
+        self.loop_thread = threading.get_ident()
+        self.beat = time.perf_counter()
+        self.enabled = True
+
+        self.task = self.loop.create_task(self.heartbeat())
+        self.thread = threading.Thread(target=self.watchdog, name="loop-monitor", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.enabled = False
+        self.thread = None
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def toggle(self):
+        if self.enabled:
+            self.stop()
+        else:
+            self.start()
+        return self.enabled
+
+    async def heartbeat(self):
+        while self.enabled:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            lag = max(now - expected, 0.0)
+            self.lags.append(lag)
+
+            # the watchdog only saw the start of the stall, fill in how long it really was
+            if self.blocks and self.blocks[-1]["beat"] == self.beat:
+                self.blocks[-1]["duration"] = lag
+            self.beat = now
+
+    def watchdog(self):
+        # a stop() and start() in quick succession leaves this thread behind the new one
+        while self.enabled and self.thread is threading.current_thread():
+            time.sleep(self.threshold / 2)
+
+            beat = self.beat
+            stalled = time.perf_counter() - beat - self.interval
+            if stalled > self.threshold and beat != self.sampled_beat:
+                self.sampled_beat = beat
+                self.sample(beat, stalled)
+
+    def sample(self, beat, stalled):
+        frame = sys._current_frames().get(self.loop_thread)
+        if frame is None:
+            return
+
+        stack = traceback.extract_stack(frame)
+        source = attribute(stack)
+        self.blocks.append({
+            "beat": beat,
+            "time": time.time(),
+            "duration": stalled,
+            "source": source,
+            "stack": stack
+        })
+
+        print(f"Warning: Event loop blocked for over {stalled * 1000:.0f}ms in {source}")
+        print("".join(stack.format()[-6:]), end="")
+
+    def stats(self):
+        lags = sorted(self.lags)
+        if not lags:
+            return {"enabled": self.enabled, "samples": 0, "avg_ms": 0, "p95_ms": 0, "max_ms": 0, "blocks": len(self.blocks)}
+
+        return {
+            "enabled": self.enabled,
+            "samples": len(lags),
+            "avg_ms": sum(lags) / len(lags) * 1000,
+            "p95_ms": lags[min(int(len(lags) * 0.95), len(lags) - 1)] * 1000,
+            "max_ms": lags[-1] * 1000,
+            "blocks": len(self.blocks)
+        }
+
+
+def location(frame):
+    path = os.path.relpath(frame.filename, root_path)
+    return f"{path}:{frame.lineno} ({frame.name})"
+
+
+def attribute(stack):
+    """
+    Names the outermost command/cog frame and the innermost parser frame of a sampled stack
+    """
+    ours = [
+        frame for frame in stack
+        if os.path.relpath(frame.filename, root_path).split(os.sep)[0] in ATTRIBUTED_FOLDERS
+    ]
+    if not ours:
+        return location(stack[-1]) if stack else "unknown"
+
+    command = next((frame for frame in ours if os.path.relpath(frame.filename, root_path).startswith("commands")), None)
+    innermost = ours[-1]
+
+    if command is None or command is innermost:
+        return location(innermost)
+    return f"{location(command)} -> {location(innermost)}"
+
+
+loop_monitor = LoopMonitor()
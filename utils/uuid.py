@@ -1,20 +1,15 @@
 import aiohttp
+from skyblock_parser.mojang import mojang_resolver
 
 
-async def getuid(username: str) -> str | None:
+async def getuid(username: str, session: aiohttp.ClientSession | None = None) -> str:
     if not username or not isinstance(username, str):
         raise ValueError("Invalidly typed, username must be a string")
 
-    url = f"https://api.mojang.com/users/profiles/minecraft/{username}"
+    # cached in memory and in ./database/mojang.db, misses go through Mojang's bulk lookup
+    uuid = (await mojang_resolver.get_uuids([username], session))[username]
+    if uuid is None:
+        # the bulk endpoint just leaves unknown names out, Mojang's single lookup answers those with a 404
+        raise ValueError(f"Username '{username}' not found. The player may not exist or may have changed their username.")
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                return data.get("id")
-            elif resp.status == 204:
-                return None
-            elif resp.status == 404:
-                raise ValueError(f"Username '{username}' not found. The player may not exist or may have changed their username.")
-            else:
-                raise RuntimeError(f"Failed to get UUID, HTTP {resp.status}")
\ No newline at end of file
+    return uuid
\ No newline at end of file